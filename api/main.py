@@ -1,64 +1,432 @@
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Response, Query, Header
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
+from fastapi.middleware.gzip import GZipMiddleware
+from pydantic import BaseModel, Field
 import numpy as np
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Optional, Any, NamedTuple, Literal, Callable, Awaitable, Set
+from collections import OrderedDict
+from functools import lru_cache, partial
+from contextlib import asynccontextmanager
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+import asyncio
+import hashlib
+import math
+import multiprocessing
+import os
+import sys
+import threading
 import traceback
-import matplotlib.pyplot as plt
 import io
-import base64
+import zlib
+import matplotlib
+matplotlib.use('Agg')  # Sin backend GUI: solo se renderiza a imagen
 from matplotlib.figure import Figure
 from matplotlib.backends.backend_agg import FigureCanvasAgg as FigureCanvas
-import matplotlib.tri as mtri
-from scipy.interpolate import griddata
-from scipy.ndimage import gaussian_filter
+from matplotlib.colorbar import make_axes_gridspec
+from PIL import Image
+from scipy.ndimage import convolve1d
+
+try:
+    from numba import njit, prange
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+try:
+    import pybase64 as base64  # Base64 con SIMD, misma interfaz que la estándar
+    HAS_PYBASE64 = True
+except ImportError:
+    import base64
+    HAS_PYBASE64 = False
+
+# Pool de procesos para el trabajo de CPU (cálculo + render de matplotlib),
+# así el event loop queda libre y los análisis corren en paralelo real.
+# Se usa 'spawn' para que los workers no hereden el estado de los hilos de
+# Numba/matplotlib del proceso principal (fork no es seguro con ellos).
+# Con varios workers del servidor (WEB_CONCURRENCY, que gunicorn también usa
+# como número de workers) los núcleos se reparten entre sus pools para no
+# lanzar más procesos de cálculo que núcleos.
+WEB_CONCURRENCY = max(1, int(os.environ.get("WEB_CONCURRENCY", "1")))
+POOL_WORKERS = max(1, (os.cpu_count() or 1) // WEB_CONCURRENCY)
+
+executor: Optional[ProcessPoolExecutor] = None
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    global executor
+    executor = ProcessPoolExecutor(max_workers=POOL_WORKERS,
+                                   mp_context=multiprocessing.get_context("spawn"))
+    try:
+        yield
+    finally:
+        # cancel_futures solo existe desde Python 3.9; antes se cancelan a mano
+        # los trabajos pendientes (los que ya corren terminan igualmente)
+        if sys.version_info >= (3, 9):
+            executor.shutdown(wait=False, cancel_futures=True)
+        else:
+            for future in list(_pool_futures):
+                future.cancel()
+            executor.shutdown(wait=False)
+        executor = None
+        _analysis_cache.clear()
+        _image_cache.clear()
 
 app = FastAPI(title="Dovela Professional API",
               description="API para análisis de dovelas diamante",
-              version="2.0.0")
+              version="2.0.0",
+              lifespan=lifespan)
+
+# Configuración de CORS para permitir peticiones desde el frontend. Los
+# orígenes se leen de CORS_ORIGINS (separados por comas) y CORS_ORIGIN_REGEX;
+# por defecto el servidor web de desarrollo y los despliegues de Vercel del
+# proyecto (producción y previews, cuyo host cambia en cada despliegue).
+# Las respuestas preflight se cachean un día.
+DEFAULT_CORS_ORIGINS = ("http://localhost:3000,http://127.0.0.1:3000,"
+                        "https://dovela-professional.vercel.app")
+DEFAULT_CORS_ORIGIN_REGEX = r"https://dovela-professional(-[a-z0-9-]+)?\.vercel\.app"
+CORS_ORIGINS = [origin.strip()
+                for origin in os.environ.get("CORS_ORIGINS", DEFAULT_CORS_ORIGINS).split(",")
+                if origin.strip()]
+CORS_ORIGIN_REGEX = os.environ.get("CORS_ORIGIN_REGEX", DEFAULT_CORS_ORIGIN_REGEX) or None
 
-# Configuración de CORS para permitir peticiones desde el frontend
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],  # En producción, limitar a tu dominio específico
+    allow_origins=CORS_ORIGINS,
+    allow_origin_regex=CORS_ORIGIN_REGEX,
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST"],
+    allow_headers=["Content-Type"],
+    max_age=86400,
 )
 
+# Compresión de las respuestas JSON (la malla en Base64 comprime bien); nivel 1
+# para que el coste de CPU sea despreciable frente al ahorro de ancho de banda
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=1)
+
+# Resolución de la malla de análisis (puntos por lado). Con 20 niveles de
+# contorno, 64x64 es visualmente equivalente a 100x100 con ~2.4x menos cálculo
+MESH_RESOLUTION = 64
+MIN_RESOLUTION = 32
+MAX_RESOLUTION = 256
+
+# Carga máxima admitida: muy por encima de cualquier dovela real y con
+# esfuerzos (< 0.82 MPa/kN) lejos del límite de float16 (65504) de la malla
+MAX_LOAD_KN = 10000.0
+
 # Modelos de datos
 class DovelaProfesionalRequest(BaseModel):
-    load_kN: float = 22.2
+    load_kN: float = Field(22.2, gt=0, le=MAX_LOAD_KN)
     thickness_mm: float = 12.7
     analysis_type: str = "von_mises"
+    resolution: int = Field(MESH_RESOLUTION, ge=MIN_RESOLUTION, le=MAX_RESOLUTION)
+    include_grid: bool = False  # malla de esfuerzos para dibujar el contorno en el cliente
+    # Imagen en Base64 dentro del JSON, como en la API original. Los clientes
+    # nuevos la desactivan y cargan la imagen binaria de GET /analyze.png (o .webp)
+    include_image: bool = True
+    image_format: Literal["png", "webp"] = "png"
 
 class DovelaProfesionalResponse(BaseModel):
     stress_max: float
     stress_min: float
-    plot_image: str  # Base64 de la imagen
+    plot_image: Optional[str] = None  # data URI Base64 (include_image)
+    # include_grid: Base64(zlib(float16 little-endian, orden C)), NaN fuera del diamante
+    stress_grid: Optional[str] = None
+    grid_shape: Optional[List[int]] = None  # [filas (y), columnas (x)]
+    grid_extent: Optional[List[float]] = None  # [x_min, x_max, y_min, y_max] en mm
     displacement_mm: float
     safety_factor: float
     analysis_summary: str
 
+# Lote de análisis (p. ej. comparar tipos de análisis para la misma carga)
+MAX_BATCH_ITEMS = 16
+
+class DovelaBatchRequest(BaseModel):
+    items: List[DovelaProfesionalRequest] = Field(..., min_length=1, max_length=MAX_BATCH_ITEMS)
+
+class AnalysisError(RuntimeError):
+    """Error del análisis (serializable entre procesos, a diferencia de HTTPException)"""
+
+# Geometría de la dovela diamante (fija para todas las peticiones)
+DOWEL_WIDTH_MM = 70
+DOWEL_LENGTH_MM = 70
+
+# Núcleo gaussiano 1-D para el suavizado (sigma fijo => se calcula una sola vez)
+SMOOTHING_SIGMA = 1.0
+
+def _gaussian_kernel1d(sigma: float, radius: int) -> np.ndarray:
+    x = np.arange(-radius, radius + 1)
+    kernel = np.exp(-0.5 * (x / sigma) ** 2)
+    return kernel / kernel.sum()
+
+SMOOTHING_KERNEL = _gaussian_kernel1d(SMOOTHING_SIGMA, radius=4)
+
+class DowelGeometry(NamedTuple):
+    """Malla y máscara reutilizables para una geometría dada"""
+    X: np.ndarray
+    Y: np.ndarray
+    diamond_mask: np.ndarray
+    mask_f: np.ndarray
+
+@lru_cache(maxsize=8)
+def _get_geometry(width_mm: float, length_mm: float, n: int) -> DowelGeometry:
+    """Construir (una sola vez por geometría) la malla y la máscara"""
+    # float32: precisión de sobra para 20 niveles de contorno y la mitad de
+    # tráfico de memoria en todo el cálculo
+    x = np.linspace(-width_mm/2, width_mm/2, n, dtype=np.float32)
+    y = np.linspace(-length_mm/2, length_mm/2, n, dtype=np.float32)
+    X, Y = np.meshgrid(x, y)
+    
+    # Máscara para forma de diamante
+    diamond_mask = (abs(X) + abs(Y) <= width_mm/2)
+    mask_f = diamond_mask.astype(np.float32)
+    
+    # Los arreglos se comparten entre peticiones: protegerlos contra escritura
+    for arr in (X, Y, diamond_mask, mask_f):
+        arr.flags.writeable = False
+    
+    return DowelGeometry(X, Y, diamond_mask, mask_f)
+
+# Tipos de análisis (el kernel de esfuerzos despacha con enteros)
+ANALYSIS_VON_MISES = 0
+ANALYSIS_PRINCIPAL = 1
+ANALYSIS_SHEAR = 2
+ANALYSIS_LTE = 3
+ANALYSIS_COMPLETE = 4
+
+ANALYSIS_KINDS = {
+    "von_mises": ANALYSIS_VON_MISES,
+    "principal": ANALYSIS_PRINCIPAL,
+    "cortante": ANALYSIS_SHEAR,
+    "lte_fisico": ANALYSIS_LTE,
+}
+
+ANALYSIS_TITLES = (
+    "Esfuerzos de Von Mises (MPa)",
+    "Esfuerzos Principales (MPa)",
+    "Esfuerzos Cortantes (MPa)",
+    "Modelo LTE - Transferencia de Carga (MPa)",
+    "Análisis Completo - Esfuerzos Combinados (MPa)",
+)
+
+def _stress_field_numpy(kind: int, X: np.ndarray, Y: np.ndarray, mask_f: np.ndarray,
+                        pressure: float, width_mm: float, length_mm: float) -> np.ndarray:
+    """Campo de esfuerzos con NumPy (respaldo cuando Numba no está disponible)"""
+    # Escalares precalculados: productos en lugar de potencias y divisiones
+    # por elemento; las operaciones reutilizan los arreglos X² e Y²
+    hw = width_mm * 0.5
+    hl = length_mm * 0.5
+    p_hw2 = pressure / (hw * hw)
+    p_hl2 = pressure / (hl * hl)
+    inv_lte2 = 1.0 / ((width_mm / 3) ** 2)
+    X2 = X * X
+    Y2 = Y * Y
+    
+    if kind == ANALYSIS_VON_MISES:
+        # Esfuerzo de Von Mises: |p (1 - r²/hw²)|
+        stress = np.add(X2, Y2, out=X2)
+        stress *= -p_hw2
+        stress += pressure
+        np.abs(stress, out=stress)
+        
+    elif kind == ANALYSIS_PRINCIPAL:
+        # Esfuerzos principales: p (1 - x²/hw² - y²/hl²)
+        X2 *= -p_hw2
+        Y2 *= -p_hl2
+        stress = np.add(X2, Y2, out=X2)
+        stress += pressure
+        
+    elif kind == ANALYSIS_SHEAR:
+        # Esfuerzos cortantes: p/2 (x² - y²)/hw²
+        stress = np.subtract(X2, Y2, out=X2)
+        stress *= 0.5 * p_hw2
+        
+    elif kind == ANALYSIS_LTE:
+        # Modelo LTE (Load Transfer Efficiency)
+        k = 0.75  # Factor de eficiencia de transferencia de carga
+        stress = np.add(X2, Y2, out=X2)
+        stress *= -inv_lte2
+        np.exp(stress, out=stress)
+        stress *= pressure * k
+        
+    else:  # Análisis completo
+        # Combinación de esfuerzos: sqrt(s_vm² + 3 s_p²)
+        stress_vm = pressure - (X2 + Y2) * p_hw2
+        X2 *= -p_hw2
+        Y2 *= -p_hl2
+        stress_p = np.add(X2, Y2, out=X2)
+        stress_p += pressure
+        stress = np.multiply(stress_vm, stress_vm, out=stress_vm)
+        np.multiply(stress_p, stress_p, out=stress_p)
+        stress_p *= 3
+        stress += stress_p
+        np.sqrt(stress, out=stress)
+    
+    # Máscara de diamante aplicada en el mismo arreglo (sin temporales)
+    np.multiply(stress, mask_f, out=stress)
+    return stress
+
+if HAS_NUMBA:
+    @njit(cache=True, parallel=True, fastmath=True)
+    def _stress_kernel(kind, X, Y, out, p, hw, hl):
+        """Campo de esfuerzos + máscara de diamante en un único recorrido de la malla"""
+        inv_hw2 = 1.0 / (hw * hw)
+        inv_hl2 = 1.0 / (hl * hl)
+        inv_lte2 = 1.0 / ((2.0 * hw / 3.0) ** 2)
+        n, m = X.shape
+        for i in prange(n):
+            for j in range(m):
+                x = X[i, j]
+                y = Y[i, j]
+                if abs(x) + abs(y) > hw:
+                    out[i, j] = 0.0
+                    continue
+                x2 = x * x
+                y2 = y * y
+                if kind == 0:
+                    value = abs(p * (1.0 - (x2 + y2) * inv_hw2))
+                elif kind == 1:
+                    value = p * (1.0 - (x2 * inv_hw2 + y2 * inv_hl2))
+                elif kind == 2:
+                    value = p * 0.5 * (x2 - y2) * inv_hw2
+                elif kind == 3:
+                    value = p * 0.75 * math.exp(-(x2 + y2) * inv_lte2)
+                else:
+                    s_vm = p * (1.0 - (x2 + y2) * inv_hw2)
+                    s_p = p * (1.0 - (x2 * inv_hw2 + y2 * inv_hl2))
+                    value = math.sqrt(s_vm * s_vm + 3.0 * s_p * s_p)
+                out[i, j] = value
+
+    @njit(cache=True)
+    def _mask_and_extrema(stress, mask_f):
+        """Aplicar la máscara en el mismo arreglo y obtener el máximo y el
+        mínimo positivo en la misma pasada (sin fastmath: se compara con inf)"""
+        smax = -np.inf
+        smin_pos = np.inf
+        n, m = stress.shape
+        for i in range(n):
+            for j in range(m):
+                value = stress[i, j] * mask_f[i, j]
+                stress[i, j] = value
+                if value > smax:
+                    smax = value
+                if 0.0 < value < smin_pos:
+                    smin_pos = value
+        return smax, smin_pos
+
+    # Compilar al importar para no pagar el JIT en la primera petición
+    # (con entradas de solo lectura, como las de la geometría cacheada)
+    _warmup = np.zeros((2, 2), dtype=np.float32)
+    _warmup_out = np.empty_like(_warmup)
+    _warmup.flags.writeable = False
+    _stress_kernel(ANALYSIS_VON_MISES, _warmup, _warmup, _warmup_out, 1.0, 1.0, 1.0)
+    _mask_and_extrema(_warmup_out, _warmup)
+    del _warmup, _warmup_out
+
+def _mask_and_extrema_numpy(stress: np.ndarray, mask_f: np.ndarray):
+    """Máscara en el mismo arreglo, máximo y mínimo positivo sin copias filtradas"""
+    np.multiply(stress, mask_f, out=stress)
+    return stress.max(), np.min(stress, where=stress > 0, initial=np.inf)
+
+# Resumen según el factor de seguridad: umbrales y mensaje de cada tramo
+# (side='right' en searchsorted reproduce las comparaciones estrictas "<")
+SF_THRESHOLDS = np.array([1.0, 1.5, 3.0])
+_SF_MSGS = (
+    "¡ADVERTENCIA! La dovela podría fallar bajo esta carga.",
+    "Diseño crítico. Se recomienda aumentar el espesor o reducir la carga.",
+    "Diseño aceptable. Factor de seguridad moderado.",
+    "Diseño seguro. Alto factor de seguridad.",
+)
+
+# Figura reutilizable por hilo: crear Figure/Axes/canvas/colorbar en cada
+# petición domina el tiempo total frente al cálculo numérico
+PLOT_FIGSIZE = (10, 8)
+PLOT_DPI = 72
+
+# Opciones de codificación: deflate mínimo para PNG (el nivel 6 por defecto
+# domina el tiempo de respuesta) y calidad con pérdida moderada para WebP
+IMAGE_SAVE_OPTIONS = {
+    "png": {"compress_level": 1, "optimize": False},
+    "webp": {"quality": 80},
+}
+
+_TLS = threading.local()
+
+class _PlotState(NamedTuple):
+    fig: Figure
+    ax: Any
+    cax: Any
+    cbar_kw: Dict[str, Any]
+    canvas: FigureCanvas
+    img_buf: io.BytesIO
+
+def _get_plot_state() -> _PlotState:
+    """Figura, ejes, eje de colorbar, canvas y buffer de imagen de este hilo (se crean una vez)"""
+    state = getattr(_TLS, 'plot', None)
+    if state is None:
+        fig = Figure(figsize=PLOT_FIGSIZE, dpi=PLOT_DPI)
+        canvas = FigureCanvas(fig)
+        ax = fig.add_subplot(111)
+        # Eje fijo para la colorbar (misma disposición que fig.colorbar(..., ax=ax))
+        cax, cbar_kw = make_axes_gridspec(ax)
+        state = _PlotState(fig, ax, cax, cbar_kw, canvas, io.BytesIO())
+        _TLS.plot = state
+    return state
+
+def _render_stress_plot(X: np.ndarray, Y: np.ndarray, Z: np.ndarray, title: str,
+                        width_mm: float, length_mm: float, image_format: str = "png") -> bytes:
+    """Dibujar el contorno de esfuerzos en la figura del hilo y devolver la imagen codificada"""
+    fig, ax, cax, cbar_kw, canvas, img_buf = _get_plot_state()
+    ax.clear()
+    cax.clear()
+    
+    contour = ax.contourf(X, Y, Z, cmap='jet', levels=20)
+    ax.set_title(title)
+    ax.set_xlabel('Ancho (mm)')
+    ax.set_ylabel('Largo (mm)')
+    ax.axis('equal')
+    fig.colorbar(contour, cax=cax, label='Esfuerzo (MPa)', **cbar_kw)
+    
+    # Añadir detalles adicionales
+    ax.set_xlim(-width_mm/2, width_mm/2)
+    ax.set_ylim(-length_mm/2, length_mm/2)
+    ax.grid(True, linestyle='--', alpha=0.7)
+    
+    # Rasterizar una vez y codificar el buffer RGBA directamente con Pillow
+    canvas.draw()
+    image = Image.frombuffer('RGBA', canvas.get_width_height(), canvas.buffer_rgba(),
+                             'raw', 'RGBA', 0, 1)
+    img_buf.seek(0)
+    img_buf.truncate(0)
+    image.save(img_buf, format=image_format, **IMAGE_SAVE_OPTIONS[image_format])
+    return img_buf.getvalue()
+
+def _encode_stress_grid(Z: np.ndarray) -> str:
+    """Malla de esfuerzos como float16 comprimido con zlib y codificado en Base64"""
+    return base64.b64encode(zlib.compress(Z.astype('<f2').tobytes())).decode('ascii')
+
+class DowelAnalysis(NamedTuple):
+    """Resultado de un análisis: campos de la respuesta JSON y malla de esfuerzos"""
+    stats: Dict[str, Any]
+    stress_field: np.ndarray  # float32, NaN fuera del diamante
+    title: str
+
 # Implementación del análisis de dovela (adaptada de tu implementación con Tkinter)
-def analyze_dowel(load_kN: float, thickness_mm: float, analysis_type: str) -> Dict[str, Any]:
+def analyze_dowel(load_kN: float, thickness_mm: float, analysis_type: str,
+                  resolution: int = MESH_RESOLUTION) -> DowelAnalysis:
     try:
         # Geometría de la dovela diamante
-        width_mm = 70
-        length_mm = 70
+        width_mm = DOWEL_WIDTH_MM
+        length_mm = DOWEL_LENGTH_MM
         
         # Propiedades del material
         E = 200000  # Módulo de Young para el acero (MPa)
         poisson = 0.3  # Coeficiente de Poisson
         yield_stress = 350  # Límite elástico para acero estructural típico (MPa)
         
-        # Generar malla para el análisis
-        x = np.linspace(-width_mm/2, width_mm/2, 100)
-        y = np.linspace(-length_mm/2, length_mm/2, 100)
-        X, Y = np.meshgrid(x, y)
-        
-        # Máscara para forma de diamante
-        diamond_mask = (abs(X) + abs(Y) <= width_mm/2)
+        # Malla para el análisis (cacheada: solo depende de la geometría)
+        geometry = _get_geometry(width_mm, length_mm, resolution)
+        X, Y = geometry.X, geometry.Y
+        diamond_mask = geometry.diamond_mask
         
         # Calcular esfuerzos (simplificación del modelo de elementos finitos)
         load_N = load_kN * 1000
@@ -66,38 +434,25 @@ def analyze_dowel(load_kN: float, thickness_mm: float, analysis_type: str) -> Di
         pressure = load_N / area_mm2
         
         # Modelo simplificado para esfuerzos
-        if analysis_type == "von_mises":
-            # Esfuerzo de Von Mises
-            stress = pressure * (1 - (X**2 + Y**2) / ((width_mm/2)**2))
-            stress = np.abs(stress) * diamond_mask
-            title = "Esfuerzos de Von Mises (MPa)"
-            
-        elif analysis_type == "principal":
-            # Esfuerzos principales
-            stress = pressure * (1 - (X**2 / (width_mm/2)**2 + Y**2 / (length_mm/2)**2))
-            stress = stress * diamond_mask
-            title = "Esfuerzos Principales (MPa)"
-            
-        elif analysis_type == "cortante":
-            # Esfuerzos cortantes
-            stress = pressure * 0.5 * (X**2 - Y**2) / ((width_mm/2)**2) * diamond_mask
-            title = "Esfuerzos Cortantes (MPa)"
-            
-        elif analysis_type == "lte_fisico":
-            # Modelo LTE (Load Transfer Efficiency)
-            k = 0.75  # Factor de eficiencia de transferencia de carga
-            stress = pressure * k * np.exp(-((X**2 + Y**2) / (width_mm/3)**2)) * diamond_mask
-            title = "Modelo LTE - Transferencia de Carga (MPa)"
-            
-        else:  # Análisis completo
-            # Combinación de esfuerzos
-            stress_vm = pressure * (1 - (X**2 + Y**2) / ((width_mm/2)**2))
-            stress_p = pressure * (1 - (X**2 / (width_mm/2)**2 + Y**2 / (length_mm/2)**2))
-            stress = np.sqrt(stress_vm**2 + 3 * stress_p**2) * diamond_mask
-            title = "Análisis Completo - Esfuerzos Combinados (MPa)"
+        kind = ANALYSIS_KINDS.get(analysis_type, ANALYSIS_COMPLETE)
+        title = ANALYSIS_TITLES[kind]
+        if HAS_NUMBA:
+            # Fórmula y máscara fusionadas en una sola pasada paralela
+            stress = np.empty_like(X)
+            _stress_kernel(kind, X, Y, stress, pressure, width_mm/2, length_mm/2)
+        else:
+            stress = _stress_field_numpy(kind, X, Y, geometry.mask_f, pressure, width_mm, length_mm)
         
-        # Suavizado para resultados más realistas
-        stress = gaussian_filter(stress, sigma=1) * diamond_mask
+        # Suavizado para resultados más realistas: convolución gaussiana
+        # separable (filas y columnas) y máscara aplicadas en el mismo arreglo
+        convolve1d(stress, SMOOTHING_KERNEL, axis=0, output=stress, mode='reflect')
+        convolve1d(stress, SMOOTHING_KERNEL, axis=1, output=stress, mode='reflect')
+        if HAS_NUMBA:
+            stress_max, stress_min = _mask_and_extrema(stress, geometry.mask_f)
+        else:
+            stress_max, stress_min = _mask_and_extrema_numpy(stress, geometry.mask_f)
+        if stress_min == np.inf:  # ningún esfuerzo positivo
+            stress_min = 0.0
         
         # Calcular deformación
         t = thickness_mm
@@ -105,82 +460,196 @@ def analyze_dowel(load_kN: float, thickness_mm: float, analysis_type: str) -> Di
         displacement = pressure * (width_mm**4) / (32 * E * t**3)
         
         # Calcular factor de seguridad
-        stress_max = np.max(stress)
         safety_factor = yield_stress / stress_max if stress_max > 0 else float('inf')
         
-        # Generar gráfico
-        fig = Figure(figsize=(10, 8))
-        canvas = FigureCanvas(fig)
-        ax = fig.add_subplot(111)
-        
-        # Usar solo los puntos dentro del diamante para el gráfico de contorno
-        mask = diamond_mask.flatten()
-        x_valid = X.flatten()[mask]
-        y_valid = Y.flatten()[mask]
-        z_valid = stress.flatten()[mask]
-        
-        # Generar una malla triangular para el contorno
-        triang = mtri.Triangulation(x_valid, y_valid)
-        
-        # Graficar contorno
-        contour = ax.tricontourf(triang, z_valid, cmap='jet', levels=20)
-        ax.set_title(title)
-        ax.set_xlabel('Ancho (mm)')
-        ax.set_ylabel('Largo (mm)')
-        ax.axis('equal')
-        fig.colorbar(contour, ax=ax, label='Esfuerzo (MPa)')
-        
-        # Añadir detalles adicionales
-        ax.set_xlim(-width_mm/2, width_mm/2)
-        ax.set_ylim(-length_mm/2, length_mm/2)
-        ax.grid(True, linestyle='--', alpha=0.7)
-        
-        # Convertir el gráfico a Base64 para enviarlo en la respuesta JSON
-        buf = io.BytesIO()
-        fig.savefig(buf, format='png', dpi=100)
-        buf.seek(0)
-        img_base64 = base64.b64encode(buf.getvalue()).decode('utf-8')
-        
         # Texto de resumen
-        if safety_factor < 1.0:
-            summary = "¡ADVERTENCIA! La dovela podría fallar bajo esta carga."
-        elif safety_factor < 1.5:
-            summary = "Diseño crítico. Se recomienda aumentar el espesor o reducir la carga."
-        elif safety_factor < 3.0:
-            summary = "Diseño aceptable. Factor de seguridad moderado."
-        else:
-            summary = "Diseño seguro. Alto factor de seguridad."
-            
-        summary += f"\nEsfuerzo máximo: {stress_max:.2f} MPa"
-        summary += f"\nDeformación máxima: {displacement:.4f} mm"
+        sf_msg = _SF_MSGS[int(np.searchsorted(SF_THRESHOLDS, safety_factor, side='right'))]
+        summary = (f"{sf_msg}\nEsfuerzo máximo: {stress_max:.2f} MPa"
+                   f"\nDeformación máxima: {displacement:.4f} mm")
         
-        return {
+        stats = {
             "stress_max": float(stress_max),
-            "stress_min": float(np.min(stress[stress > 0])) if np.any(stress > 0) else 0.0,
-            "plot_image": f"data:image/png;base64,{img_base64}",
+            "stress_min": float(stress_min),
             "displacement_mm": float(displacement),
             "safety_factor": float(safety_factor),
             "analysis_summary": summary
         }
         
+        # Los datos ya están en una malla regular, con NaN fuera del diamante;
+        # la misma malla sirve para la imagen y para dibujar en el cliente
+        Z = np.where(diamond_mask, stress, np.nan)
+        return DowelAnalysis(stats, Z, title)
+        
     except Exception as e:
         # Log error para debugging
         error_trace = traceback.format_exc()
         print(f"Error en análisis: {error_trace}")
-        raise HTTPException(status_code=500, detail=f"Error en el análisis: {str(e)}")
+        raise AnalysisError(f"Error en el análisis: {str(e)}") from e
+
+def render_dowel_image(stress_field: np.ndarray, title: str, image_format: str = "png") -> bytes:
+    """Imagen del contorno de esfuerzos de un análisis ya calculado"""
+    try:
+        width_mm = DOWEL_WIDTH_MM
+        length_mm = DOWEL_LENGTH_MM
+        geometry = _get_geometry(width_mm, length_mm, stress_field.shape[0])
+        # Contorno directo sobre la malla (matplotlib enmascara los NaN)
+        return _render_stress_plot(geometry.X, geometry.Y, stress_field, title,
+                                   width_mm, length_mm, image_format)
+    except Exception as e:
+        error_trace = traceback.format_exc()
+        print(f"Error en render: {error_trace}")
+        raise AnalysisError(f"Error al generar la imagen: {str(e)}") from e
+
+# Caché de resultados: el análisis es determinista, así que peticiones
+# repetidas (con entradas redondeadas) reutilizan el resultado ya calculado
+# sin pasar por el pool. Solo se guardan resultados correctos; las peticiones
+# idénticas simultáneas comparten el cálculo en curso.
+RESULT_CACHE_SIZE = 256  # ~25 kB por análisis a 64x64
+IMAGE_CACHE_SIZE = 128  # ~60 kB por imagen PNG
+INPUT_DECIMALS = 3
+CACHE_CONTROL = "public, max-age=3600"  # solo para la imagen (GET)
+
+# Respaldo si la app corre sin lifespan (p. ej. en funciones serverless)
+_thread_executor = ThreadPoolExecutor()
+
+# Trabajos enviados al pool y aún sin terminar (para cancelarlos al apagar)
+_pool_futures: Set[Future] = set()
+
+def _get_pool():
+    return executor if executor is not None else _thread_executor
+
+async def _run_in_pool(fn: Callable[..., Any], *args: Any) -> Any:
+    """Ejecutar una función de CPU en el pool sin bloquear el event loop"""
+    future = _get_pool().submit(fn, *args)
+    _pool_futures.add(future)
+    future.add_done_callback(_pool_futures.discard)
+    return await asyncio.wrap_future(future)
+
+class _ResultCache:
+    """Caché LRU de resultados con deduplicación de los cálculos en curso.
+    
+    Cada cálculo corre como una tarea propia y las peticiones la esperan con
+    asyncio.shield: si un cliente se desconecta se cancela su espera, no el
+    cálculo compartido. Errores y cancelaciones no se guardan, de modo que la
+    siguiente petición con la misma clave vuelve a calcular."""
+    
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._results: "OrderedDict[tuple, Any]" = OrderedDict()
+        self._pending: Dict[tuple, asyncio.Future] = {}
+    
+    async def get(self, key: tuple, compute: Callable[[], Awaitable[Any]]) -> Any:
+        if key in self._results:
+            self._results.move_to_end(key)
+            return self._results[key]
+        task = self._pending.get(key)
+        if task is None:
+            task = asyncio.ensure_future(compute())
+            self._pending[key] = task
+            task.add_done_callback(partial(self._store, key))
+        return await asyncio.shield(task)
+    
+    def _store(self, key: tuple, task: asyncio.Future):
+        # Se ejecuta en el event loop al terminar el cálculo
+        if self._pending.get(key) is task:
+            del self._pending[key]
+        if task.cancelled() or task.exception() is not None:
+            return
+        self._results[key] = task.result()
+        if len(self._results) > self.maxsize:
+            self._results.popitem(last=False)
+    
+    def clear(self):
+        self._results.clear()
+        self._pending.clear()
+
+_analysis_cache = _ResultCache(RESULT_CACHE_SIZE)
+_image_cache = _ResultCache(IMAGE_CACHE_SIZE)
+
+def _analysis_key(load_kN: float, thickness_mm: float, analysis_type: str, resolution: int) -> tuple:
+    """Clave de caché de un análisis (entradas numéricas redondeadas)"""
+    return (round(load_kN, INPUT_DECIMALS), round(thickness_mm, INPUT_DECIMALS),
+            analysis_type, resolution)
+
+async def _get_analysis(key: tuple) -> DowelAnalysis:
+    """Análisis de estas entradas, calculado en el pool una sola vez"""
+    return await _analysis_cache.get(key, lambda: _run_in_pool(analyze_dowel, *key))
+
+async def _get_image(key: tuple, image_format: str) -> bytes:
+    """Imagen del contorno a partir del análisis cacheado, sin repetir el cálculo"""
+    async def render() -> bytes:
+        analysis = await _get_analysis(key)
+        return await _run_in_pool(render_dowel_image, analysis.stress_field,
+                                  analysis.title, image_format)
+    return await _image_cache.get(key + (image_format,), render)
+
+async def _await_result(awaitable: Awaitable[Any]) -> Any:
+    """Esperar un resultado del pool y traducir los errores del análisis a HTTP"""
+    try:
+        return await awaitable
+    except AnalysisError as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+async def _run_analysis(request: DovelaProfesionalRequest) -> Dict[str, Any]:
+    """Ejecutar (o recuperar de la caché) un análisis y armar la respuesta JSON"""
+    key = _analysis_key(request.load_kN, request.thickness_mm,
+                        request.analysis_type, request.resolution)
+    analysis = await _await_result(_get_analysis(key))
+    result = dict(analysis.stats)
+    if request.include_grid:
+        # Sin render en el servidor: se envía la malla para dibujarla en el cliente
+        # (codificada solo cuando se pide, fuera del event loop)
+        result["stress_grid"] = await asyncio.get_running_loop().run_in_executor(
+            _thread_executor, _encode_stress_grid, analysis.stress_field)
+        result["grid_shape"] = list(analysis.stress_field.shape)
+        result["grid_extent"] = [-DOWEL_WIDTH_MM/2, DOWEL_WIDTH_MM/2,
+                                 -DOWEL_LENGTH_MM/2, DOWEL_LENGTH_MM/2]
+    if request.include_image:
+        # Misma imagen cacheada que sirve GET /analyze.{png,webp}
+        image = await _await_result(_get_image(key, request.image_format))
+        encoded = base64.b64encode(image).decode('ascii')
+        result["plot_image"] = f"data:image/{request.image_format};base64,{encoded}"
+    return result
+
+def _image_etag(key: tuple, image_format: str) -> str:
+    """ETag estable entre procesos y reinicios (no usa hash(), que es aleatorio por proceso)"""
+    digest = hashlib.blake2b(repr((app.version, key, image_format)).encode(), digest_size=12)
+    return f'"{digest.hexdigest()}"'
 
 @app.get("/")
 def read_root():
     return {"message": "Dovela Professional API v2.0", "status": "active"}
 
-@app.post("/analyze", response_model=DovelaProfesionalResponse)
-def analyze_dowel_endpoint(request: DovelaProfesionalRequest):
-    result = analyze_dowel(
-        load_kN=request.load_kN,
-        thickness_mm=request.thickness_mm,
-        analysis_type=request.analysis_type
-    )
-    return result
+@app.post("/analyze", response_model=DovelaProfesionalResponse, response_model_exclude_none=True)
+async def analyze_dowel_endpoint(request: DovelaProfesionalRequest):
+    return await _run_analysis(request)
+
+@app.post("/analyze_batch", response_model=List[DovelaProfesionalResponse],
+          response_model_exclude_none=True)
+async def analyze_batch_endpoint(request: DovelaBatchRequest):
+    # Los análisis del lote se envían juntos al pool y corren en paralelo
+    return await asyncio.gather(*(_run_analysis(item) for item in request.items))
+
+@app.get("/analyze.{image_format}", response_class=Response)
+async def analyze_image_endpoint(image_format: Literal["png", "webp"],
+                                 load_kN: float = Query(22.2, gt=0, le=MAX_LOAD_KN),
+                                 thickness_mm: float = 12.7,
+                                 analysis_type: str = "von_mises",
+                                 resolution: int = Query(MESH_RESOLUTION, ge=MIN_RESOLUTION,
+                                                         le=MAX_RESOLUTION),
+                                 if_none_match: Optional[str] = Header(None)):
+    # Imagen binaria (sin Base64) y cacheable por el navegador; comparte el
+    # análisis cacheado con POST /analyze
+    key = _analysis_key(load_kN, thickness_mm, analysis_type, resolution)
+    headers = {"ETag": _image_etag(key, image_format), "Cache-Control": CACHE_CONTROL}
+    if if_none_match:
+        # Comparación débil (RFC 7232): se ignora el prefijo W/ de cada etiqueta
+        client_tags = {tag[2:] if tag.startswith("W/") else tag
+                       for tag in (tag.strip() for tag in if_none_match.split(","))}
+        if headers["ETag"] in client_tags or "*" in client_tags:
+            return Response(status_code=304, headers=headers)
+    image = await _await_result(_get_image(key, image_format))
+    return Response(content=image, media_type=f"image/{image_format}", headers=headers)
 
 if __name__ == "__main__":
     import uvicorn
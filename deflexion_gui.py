@@ -1,22 +1,184 @@
 # Interfaz gráfica para Deflexión de Media Dovela
 # -*- coding: utf-8 -*-
+import math
 import tkinter as tk
 from tkinter import ttk, messagebox
-import matplotlib.pyplot as plt
 import matplotlib.tri as mtri
+from matplotlib.figure import Figure
+from matplotlib.patches import Patch
+import matplotlib.lines as mlines
+from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
 import numpy as np
-from skfem import MeshTri, ElementTriP1, Basis, asm, solve
+from skfem import MeshTri, ElementTriP1, Basis
 from skfem.assembly import BilinearForm, LinearForm
 import pygmsh
 from skfem import condense
 from skfem.helpers import dot, grad
-from scipy.interpolate import griddata
+from scipy.sparse.linalg import splu
 import traceback
+from types import SimpleNamespace
+from typing import NamedTuple
+
+try:
+    from numba import njit, prange
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+if HAS_NUMBA:
+    # Firma explícita: se compila (o se carga de la caché en disco) al importar,
+    # especializada a columnas float64 contiguas, sin esperar al primer análisis LTE
+    @njit("float64[::1](float64[::1], float64[::1], float64, float64, float64, float64)",
+          cache=True, fastmath=True, parallel=True)
+    def _lte_distribute(xs, ys, cx, cy, max_radius, lte_corrected):
+        """Distribuir el LTE en los nodos con atenuación radial (un recorrido)"""
+        n = xs.shape[0]
+        lte_values = np.empty(n)
+        for i in prange(n):
+            dx = xs[i] - cx
+            dy = ys[i] - cy
+            if max_radius > 0:
+                r_norm = np.sqrt(dx * dx + dy * dy) / max_radius
+                distance_factor = 1.0 - r_norm * np.sqrt(r_norm) * 0.25
+            else:
+                distance_factor = 1.0
+            distance_factor = min(1.0, max(0.7, distance_factor))
+            lte_values[i] = min(90.0, max(45.0, lte_corrected * distance_factor))
+        return lte_values
+else:
+    def _lte_distribute(xs, ys, cx, cy, max_radius, lte_corrected):
+        """Distribuir el LTE en los nodos con atenuación radial (NumPy)"""
+        if max_radius > 0:
+            r_norm = np.hypot(xs - cx, ys - cy) / max_radius
+            distance_factor = 1 - r_norm * np.sqrt(r_norm) * 0.25  # r^1.5 sin pow()
+        else:
+            distance_factor = np.ones(len(xs))
+        distance_factor = np.clip(distance_factor, 0.7, 1.0)  # Entre 70% y 100%
+        return np.clip(lte_corrected * distance_factor, 45, 90)  # Rango físico realista
+
+class UnitPolicy:
+    """Factores fijos de conversión del sistema de entrada a mm/kN/MPa e in/tons/ksi"""
+    __slots__ = ('name', 'to_mm', 'to_in', 'to_kN', 'to_tons', 'to_MPa', 'to_ksi',
+                 'unit_len', 'unit_load', 'unit_E', 'unit_fc')
+
+    def __init__(self, name, to_mm, to_kN, to_MPa, unit_len, unit_load, unit_E, unit_fc):
+        self.name = name
+        self.to_mm = to_mm
+        self.to_in = to_mm / 25.4
+        self.to_kN = to_kN
+        self.to_tons = to_kN / 4.448
+        self.to_MPa = to_MPa
+        self.to_ksi = to_MPa / 6.895
+        self.unit_len = unit_len
+        self.unit_load = unit_load
+        self.unit_E = unit_E
+        self.unit_fc = unit_fc
+
+# Políticas únicas: se eligen una vez al cambiar el sistema de unidades
+METRIC = UnitPolicy("metric", 1.0, 1.0, 1.0, "mm", "kN", "MPa", "MPa")
+IMPERIAL = UnitPolicy("imperial", 25.4, 4.448, 6.895, "in", "tons", "ksi", "psi")
+
+class StressFields(NamedTuple):
+    """Campos nodales de esfuerzo (ksi) obtenidos en una sola pasada"""
+    von_mises: np.ndarray
+    principal_max: np.ndarray
+    principal_min: np.ndarray
+    shear: np.ndarray
+
+# Constantes geométricas del diamante (evitan np.sqrt sobre escalares). Se
+# divide por _SQRT2 en lugar de multiplicar por su inverso para que X1 sea
+# idéntico bit a bit y la malla generada no cambie
+_SQRT2 = math.sqrt(2)
+_INV_SQRT3 = 1.0 / math.sqrt(3)
+_SQRT3_OVER_2 = math.sqrt(3) / 2
+_SQRT3_OVER_4 = math.sqrt(3) / 4
+
+# Número de geometrías/soluciones FEM que se conservan entre análisis
+FEM_CACHE_SIZE = 8
+
+# Los contornos solo necesitan precisión simple: la solución FEM sigue en
+# float64 y se convierte justo antes de graficar
+PLOT_DTYPE = np.float32
+
+# Campos de entrada: (fila, clave, variable Tk, etiqueta, atributo de unidad en UnitPolicy).
+# Las filas sin unidad (Poisson) conservan una etiqueta fija.
+DOWEL_FIELDS = (
+    (0, 'side', 'side_mm', "Lado total del diamante", 'unit_len'),
+    (1, 'thickness', 'thickness_in', "Espesor dovela", 'unit_len'),
+    (2, 'load', 'tons_load', "Carga aplicada", 'unit_load'),
+    (3, 'joint', 'ap_mm', "Apertura de junta", 'unit_len'),
+    (5, 'E_dowel', 'E_dowel', "Módulo E dovela", 'unit_E'),
+    (6, 'nu_dowel', 'nu_dowel', "Poisson ν dovela", None),
+)
+CONCRETE_FIELDS = (
+    (0, 'slab_thickness', 'slab_thickness', "Espesor losa concreto", 'unit_len'),
+    (1, 'fc', 'fc_concrete', "f'c concreto", 'unit_fc'),
+    (2, 'E_concrete', 'E_concrete', "Módulo E concreto", 'unit_E'),
+    (3, 'nu_concrete', 'nu_concrete', "Poisson ν concreto", None),
+)
+
+# Elementos fijos de las gráficas LTE (no dependen de los datos): parches de
+# leyenda del mapa por zonas, bandas del perfil y líneas de referencia
+LTE_LEGEND_PATCHES = [
+    Patch(facecolor='#ff4444', alpha=0.8, label='[D] Deficiente (0-70%)'),
+    Patch(facecolor='#ff8800', alpha=0.8, label='[M] Marginal (70-80%)'),
+    Patch(facecolor='#ffdd00', alpha=0.8, label='[A] Aceptable (80-90%)'),
+    Patch(facecolor='#44aa44', alpha=0.8, label='[O] Optima (90-100%)')
+]
+LTE_PROFILE_BANDS = (
+    (0, 70, 'red', 'Zona Deficiente (0-70%)'),
+    (70, 80, 'orange', 'Zona Marginal (70-80%)'),
+    (80, 90, 'yellow', 'Zona Aceptable (80-90%)'),
+    (90, 100, 'green', 'Zona Óptima (90-100%)'),
+)
+LTE_REFERENCE_LINES = ((70, 'red'), (80, 'orange'), (90, 'green'))
+
+class LteRating(NamedTuple):
+    """Textos y colores de un nivel de LTE (umbral inferior en %)"""
+    threshold: float
+    label: str
+    color: str
+    evaluation: str
+    status: str
+    effectiveness: str
+    recommendation: str
+    level: str
+    conclusion: str
+
+# Niveles de LTE del mejor al peor; se toma el primero cuyo umbral se alcanza
+LTE_RATINGS = (
+    LteRating(90, "EXCELENTE", "green", "✅ EXCELENTE - Transferencia óptima", "🟢", "Óptima",
+              "Diseño óptimo - Mantener configuración", "excelente", "El sistema funciona óptimamente."),
+    LteRating(80, "BUENO", "darkgreen", "⚠️ ACEPTABLE - Transferencia adecuada", "🟡", "Adecuada",
+              "Incrementar diámetro de dovela", "aceptable", "Se recomienda monitoreo del desempeño."),
+    LteRating(70, "ACEPTABLE", "orange", "⚠️ MARGINAL - Necesita mejoras", "🟠", "Mejorable",
+              "Reducir espaciamiento entre dovelas", "mejorable", "Se sugieren mejoras al diseño."),
+    LteRating(0, "DEFICIENTE", "red", "❌ DEFICIENTE - Rediseñar sistema", "🔴", "Mejorable",
+              "Rediseñar completamente el sistema", "deficiente", "Es necesario rediseñar el sistema de transferencia."),
+)
+
+def _lte_rating(lte_average):
+    """Nivel de LTE correspondiente a un promedio (el peor si no alcanza ningún umbral)"""
+    return next((r for r in LTE_RATINGS if lte_average >= r.threshold), LTE_RATINGS[-1])
 
 class DeflexionApp:
+    # Kernel de distribución LTE (compilado con Numba una sola vez si está disponible)
+    _lte_kernel = staticmethod(_lte_distribute)
+
     def __init__(self, root):
         self.root = root
         root.title("Análisis FEA de Dovela Diamante - Transferencia de Carga")
+        # Cachés FEM: geometría (malla, base, rigidez) y solución completa
+        self._geometry_cache = {}
+        self._fem_cache = {}
+        self._triang_cache = None
+        self._stress_cache = None
+        self.units = None  # Lo fija update_units al crear la interfaz
+        # Ventana de resultados con una única figura que se reutiliza
+        self._plot_window = None
+        self._plot_figsize = None
+        self.fig = None
+        self.canvas = None
         self.create_widgets()
 
     def create_widgets(self):
@@ -58,70 +220,17 @@ class DeflexionApp:
         dowel_frame.grid(row=1, column=0, columnspan=2, sticky="ew", pady=(0,10))
 
         self.labels = {}  # Para actualizar dinámicamente las etiquetas
-        
-        # Fila 0: Lado del diamante
-        self.labels['side'] = ttk.Label(dowel_frame, text="Lado total del diamante (mm)")
-        self.labels['side'].grid(row=0, column=0, sticky="w")
-        self.entry_side = ttk.Entry(dowel_frame, textvariable=self.side_mm)
-        self.entry_side.grid(row=0, column=1)
-        
-        # Fila 1: Espesor dovela
-        self.labels['thickness'] = ttk.Label(dowel_frame, text="Espesor dovela (mm)")
-        self.labels['thickness'].grid(row=1, column=0, sticky="w")
-        self.entry_thickness = ttk.Entry(dowel_frame, textvariable=self.thickness_in)
-        self.entry_thickness.grid(row=1, column=1)
-        
-        # Fila 2: Carga aplicada
-        self.labels['load'] = ttk.Label(dowel_frame, text="Carga aplicada (kN)")
-        self.labels['load'].grid(row=2, column=0, sticky="w")
-        self.entry_load = ttk.Entry(dowel_frame, textvariable=self.tons_load)
-        self.entry_load.grid(row=2, column=1)
-        
-        # Fila 3: Apertura de junta
-        self.labels['joint'] = ttk.Label(dowel_frame, text="Apertura de junta (mm)")
-        self.labels['joint'].grid(row=3, column=0, sticky="w")
-        self.entry_joint = ttk.Entry(dowel_frame, textvariable=self.ap_mm)
-        self.entry_joint.grid(row=3, column=1)
-        
+        self.entries = {}
+        self._build_fields(dowel_frame, DOWEL_FIELDS)
+
         # Fila 4: Lado cargado
         ttk.Label(dowel_frame, text="Lado cargado").grid(row=4, column=0, sticky="w")
         ttk.Combobox(dowel_frame, textvariable=self.loaded_side, values=["right", "left"]).grid(row=4, column=1)
-        
-        # Fila 5: Módulo E dovela
-        self.labels['E_dowel'] = ttk.Label(dowel_frame, text="Módulo E dovela (MPa)")
-        self.labels['E_dowel'].grid(row=5, column=0, sticky="w")
-        self.entry_E_dowel = ttk.Entry(dowel_frame, textvariable=self.E_dowel)
-        self.entry_E_dowel.grid(row=5, column=1)
-        
-        # Fila 6: Poisson dovela
-        ttk.Label(dowel_frame, text="Poisson ν dovela").grid(row=6, column=0, sticky="w")
-        ttk.Entry(dowel_frame, textvariable=self.nu_dowel).grid(row=6, column=1)
 
         # Parámetros del concreto
         concrete_frame = ttk.LabelFrame(frame, text="Parámetros del Concreto (Losas)", padding=5)
         concrete_frame.grid(row=2, column=0, columnspan=2, sticky="ew", pady=(0,10))
-        
-        # Fila 0: Espesor losa
-        self.labels['slab_thickness'] = ttk.Label(concrete_frame, text="Espesor losa concreto (mm)")
-        self.labels['slab_thickness'].grid(row=0, column=0, sticky="w")
-        self.entry_slab = ttk.Entry(concrete_frame, textvariable=self.slab_thickness)
-        self.entry_slab.grid(row=0, column=1)
-        
-        # Fila 1: Resistencia concreto
-        self.labels['fc'] = ttk.Label(concrete_frame, text="f'c concreto (MPa)")
-        self.labels['fc'].grid(row=1, column=0, sticky="w")
-        self.entry_fc = ttk.Entry(concrete_frame, textvariable=self.fc_concrete)
-        self.entry_fc.grid(row=1, column=1)
-        
-        # Fila 2: Módulo E concreto
-        self.labels['E_concrete'] = ttk.Label(concrete_frame, text="Módulo E concreto (MPa)")
-        self.labels['E_concrete'].grid(row=2, column=0, sticky="w")
-        self.entry_E_concrete = ttk.Entry(concrete_frame, textvariable=self.E_concrete)
-        self.entry_E_concrete.grid(row=2, column=1)
-        
-        # Fila 3: Poisson concreto
-        ttk.Label(concrete_frame, text="Poisson ν concreto").grid(row=3, column=0, sticky="w")
-        ttk.Entry(concrete_frame, textvariable=self.nu_concrete).grid(row=3, column=1)
+        self._build_fields(concrete_frame, CONCRETE_FIELDS)
         
         # Selector de tipo de análisis
         analysis_frame = ttk.LabelFrame(frame, text="Tipo de Análisis FEA", padding=5)
@@ -154,52 +263,99 @@ class DeflexionApp:
         # Configurar valores iniciales para sistema métrico
         self.update_units()
 
+    def _build_fields(self, parent, fields):
+        """Crear etiqueta y entrada para cada fila de una tabla de campos"""
+        for row, key, var_name, text, unit_attr in fields:
+            label = ttk.Label(parent, text=text)  # update_units añade la unidad
+            label.grid(row=row, column=0, sticky="w")
+            entry = ttk.Entry(parent, textvariable=getattr(self, var_name))
+            entry.grid(row=row, column=1)
+            if unit_attr is not None:
+                self.labels[key] = label
+            self.entries[key] = entry
+
     def update_units(self):
         """Actualizar etiquetas y valores según el sistema de unidades seleccionado"""
-        if self.unit_system.get() == "metric":
-            # Sistema Internacional (SI)
-            self.labels['side'].config(text="Lado total del diamante (mm)")
-            self.labels['thickness'].config(text="Espesor dovela (mm)")
-            self.labels['load'].config(text="Carga aplicada (kN)")
-            self.labels['joint'].config(text="Apertura de junta (mm)")
-            self.labels['E_dowel'].config(text="Módulo E dovela (MPa)")
-            self.labels['slab_thickness'].config(text="Espesor losa concreto (mm)")
-            self.labels['fc'].config(text="f'c concreto (MPa)")
-            self.labels['E_concrete'].config(text="Módulo E concreto (MPa)")
-            
+        units = METRIC if self.unit_system.get() == "metric" else IMPERIAL
+        if units is self.units:
+            return  # Mismo sistema: no hay etiquetas que reconfigurar
+        first_call = self.units is None
+        self.units = units
+
+        for fields in (DOWEL_FIELDS, CONCRETE_FIELDS):
+            for _, key, _, text, unit_attr in fields:
+                if unit_attr is not None:
+                    self.labels[key].config(text=f"{text} ({getattr(units, unit_attr)})")
+
+        # Valores típicos solo al construir la interfaz
+        if not first_call:
+            return
+        if units is METRIC:
             # Valores típicos SI
-            if not hasattr(self, '_units_initialized'):
-                self.side_mm.set(125.0)
-                self.thickness_in.set(12.7)  # 12.7 mm = 0.5 in
-                self.tons_load.set(22.24)   # 22.24 kN = 5 tons
-                self.ap_mm.set(4.8)
-                self.E_dowel.set(200000.0)  # MPa para acero
-                self.slab_thickness.set(200.0)  # mm
-                self.fc_concrete.set(25.0)  # MPa
-                self.E_concrete.set(25000.0)  # MPa
+            self.side_mm.set(125.0)
+            self.thickness_in.set(12.7)  # 12.7 mm = 0.5 in
+            self.tons_load.set(22.24)   # 22.24 kN = 5 tons
+            self.ap_mm.set(4.8)
+            self.E_dowel.set(200000.0)  # MPa para acero
+            self.slab_thickness.set(200.0)  # mm
+            self.fc_concrete.set(25.0)  # MPa
+            self.E_concrete.set(25000.0)  # MPa
         else:
-            # Sistema Inglés (Imperial)
-            self.labels['side'].config(text="Lado total del diamante (in)")
-            self.labels['thickness'].config(text="Espesor dovela (in)")
-            self.labels['load'].config(text="Carga aplicada (tons)")
-            self.labels['joint'].config(text="Apertura de junta (in)")
-            self.labels['E_dowel'].config(text="Módulo E dovela (ksi)")
-            self.labels['slab_thickness'].config(text="Espesor losa concreto (in)")
-            self.labels['fc'].config(text="f'c concreto (psi)")
-            self.labels['E_concrete'].config(text="Módulo E concreto (ksi)")
-            
             # Valores típicos Imperial
-            if not hasattr(self, '_units_initialized'):
-                self.side_mm.set(4.92)      # 125 mm = 4.92 in
-                self.thickness_in.set(0.5)   # in
-                self.tons_load.set(5.0)      # tons
-                self.ap_mm.set(0.189)        # 4.8 mm = 0.189 in
-                self.E_dowel.set(29000.0)    # ksi para acero
-                self.slab_thickness.set(7.87)  # 200 mm = 7.87 in
-                self.fc_concrete.set(3625.0)   # 25 MPa = 3625 psi
-                self.E_concrete.set(3625.0)    # 25000 MPa = 3625 ksi
-        
-        self._units_initialized = True
+            self.side_mm.set(4.92)      # 125 mm = 4.92 in
+            self.thickness_in.set(0.5)   # in
+            self.tons_load.set(5.0)      # tons
+            self.ap_mm.set(0.189)        # 4.8 mm = 0.189 in
+            self.E_dowel.set(29000.0)    # ksi para acero
+            self.slab_thickness.set(7.87)  # 200 mm = 7.87 in
+            self.fc_concrete.set(3625.0)   # 25 MPa = 3625 psi
+            self.E_concrete.set(3625.0)    # 25000 MPa = 3625 ksi
+
+    def _results_figure(self, title, nrows=1, ncols=1, figsize=(10, 8)):
+        """Limpiar la figura persistente de resultados y devolver sus ejes, con el
+        tamaño propio de cada disposición (pulgadas)"""
+        if self._plot_window is None or not self._plot_window.winfo_exists():
+            self._plot_window = tk.Toplevel(self.root)
+            self.fig = Figure(figsize=figsize)
+            self.canvas = FigureCanvasTkAgg(self.fig, master=self._plot_window)
+            NavigationToolbar2Tk(self.canvas, self._plot_window)
+            self.canvas.get_tk_widget().pack(side="top", fill="both", expand=True)
+        elif figsize != self._plot_figsize:
+            # El widget de Tk impone su tamaño a la figura al redimensionarse:
+            # ajustar ambos y devolver la ventana a su tamaño natural
+            self.fig.set_size_inches(figsize)
+            width, height = self.canvas.get_width_height(physical=True)
+            self.canvas.get_tk_widget().configure(width=width, height=height)
+            self._plot_window.geometry("")
+        self._plot_figsize = figsize
+        self._plot_window.title(title)
+        self.fig.clear()  # También elimina las barras de color anteriores
+        return self.fig.subplots(nrows, ncols)
+
+    def _draw_results(self):
+        """Redibujar la figura de resultados y traer su ventana al frente"""
+        self.fig.tight_layout()
+        self.canvas.draw_idle()
+        self._plot_window.deiconify()
+        self._plot_window.lift()
+
+    def _snapshot_inputs(self):
+        """Leer una sola vez todas las variables de Tk para un análisis"""
+        return SimpleNamespace(
+            unit_system=self.units.name,
+            units=self.units,
+            side_mm=self.side_mm.get(),
+            thickness_in=self.thickness_in.get(),
+            tons_load=self.tons_load.get(),
+            ap_mm=self.ap_mm.get(),
+            loaded_side=self.loaded_side.get(),
+            E_dowel=self.E_dowel.get(),
+            nu_dowel=self.nu_dowel.get(),
+            E_concrete=self.E_concrete.get(),
+            nu_concrete=self.nu_concrete.get(),
+            slab_thickness=self.slab_thickness.get(),
+            fc_concrete=self.fc_concrete.get(),
+        )
 
     def run_analysis(self):
         """Ejecutar análisis individual según el tipo seleccionado"""
@@ -303,31 +459,31 @@ en juntas de construcción o expansión.
         """Ejecutar análisis completo con múltiples visualizaciones"""
         try:
             # Calcular los resultados base
-            mesh, w_vals, coords, triangs, mask_tri = self.calculate_base_results()
+            inp = self._snapshot_inputs()
+            mesh, w_vals, coords, triangs, mask_tri = self.calculate_base_results(inp)
             
             # Crear figura con 4 subplots
-            fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(16, 12))
+            ((ax1, ax2), (ax3, ax4)) = self._results_figure("Análisis Completo", 2, 2, figsize=(16, 12))
             
             # 1. Deflexión
-            self.plot_deflection_contour(ax1, mesh, w_vals, coords, triangs, mask_tri)
+            self.plot_deflection_contour(ax1, mesh, w_vals.astype(PLOT_DTYPE), coords, triangs, mask_tri, inp=inp)
+            
+            # Todos los campos de esfuerzo en una sola pasada
+            stress_vm, stress_p1, stress_p2, stress_shear = self._compute_all_stresses(mesh, w_vals, coords, inp)
             
             # 2. Esfuerzo von Mises
-            stress_vm = self.calculate_von_mises_stress(mesh, w_vals, coords)
-            self.plot_stress_contour(ax2, stress_vm, coords, triangs, mask_tri, "von Mises (Criterio de Falla)", "plasma")
+            self.plot_stress_contour(ax2, stress_vm.astype(PLOT_DTYPE), coords, triangs, mask_tri, "von Mises (Criterio de Falla)", "plasma", inp=inp)
             
             # 3. Esfuerzo Principal Máximo
-            stress_p1, stress_p2 = self.calculate_principal_stresses(mesh, w_vals, coords)
-            self.plot_stress_contour(ax3, stress_p1, coords, triangs, mask_tri, "Principal Máximo (Tensión)", "viridis")
+            self.plot_stress_contour(ax3, stress_p1.astype(PLOT_DTYPE), coords, triangs, mask_tri, "Principal Máximo (Tensión)", "viridis", inp=inp)
             
             # 4. Esfuerzo Cortante Máximo
-            stress_shear = self.calculate_shear_stress(stress_p1, stress_p2)
-            self.plot_stress_contour(ax4, stress_shear, coords, triangs, mask_tri, "Cortante Máximo (Corte)", "coolwarm")
+            self.plot_stress_contour(ax4, stress_shear.astype(PLOT_DTYPE), coords, triangs, mask_tri, "Cortante Máximo (Corte)", "coolwarm", inp=inp)
             
-            plt.tight_layout()
-            plt.show()
+            self._draw_results()
             
             # Mostrar resumen de resultados
-            self.show_results_summary(w_vals, stress_vm, stress_p1, stress_shear)
+            self.show_results_summary(w_vals, stress_vm, stress_p1, stress_shear, inp=inp)
             
         except Exception as e:
             tb = traceback.format_exc()
@@ -337,62 +493,41 @@ en juntas de construcción o expansión.
         """Calcular y visualizar Load Transfer Efficiency (LTE)"""
         try:
             # Calcular resultados base
-            mesh, w_vals, coords, triangs, mask_tri = self.calculate_base_results()
+            inp = self._snapshot_inputs()
+            mesh, w_vals, coords, triangs, mask_tri = self.calculate_base_results(inp)
             
             # Calcular LTE y su distribución
-            lte_values, lte_average, transfer_force = self.calculate_load_transfer_efficiency(mesh, w_vals, coords)
+            lte_values, lte_average, transfer_force = self.calculate_load_transfer_efficiency(mesh, w_vals, coords, inp=inp)
             
             # Crear visualización del LTE - Solo gráfica de distribución
-            fig, ax = plt.subplots(1, 1, figsize=(12, 10))
+            ax = self._results_figure("Load Transfer Efficiency (LTE)", figsize=(12, 10))
             
             # Gráfica única: Distribución de LTE en la dovela
-            self.plot_lte_distribution(ax, lte_values, coords, triangs, mask_tri)
+            self.plot_lte_distribution(ax, lte_values.astype(PLOT_DTYPE), coords, triangs, mask_tri, inp=inp)
             
-            plt.tight_layout()
-            plt.show()
+            self._draw_results()
             
             # Mostrar resumen del LTE
-            self.show_lte_summary(lte_average, transfer_force, lte_values)
+            self.show_lte_summary(lte_average, transfer_force, lte_values, inp=inp)
             
         except Exception as e:
             tb = traceback.format_exc()
             messagebox.showerror("Error", f"{str(e)}\n\n{tb}")
 
-    def calculate_load_transfer_efficiency(self, mesh, w_vals, coords):
+    def calculate_load_transfer_efficiency(self, mesh, w_vals, coords, inp=None):
         """Calcular Load Transfer Efficiency (LTE) usando método estándar"""
+        inp = inp or self._snapshot_inputs()
         
-        # Obtener parámetros
-        side_input = self.side_mm.get()
-        thickness_input = self.thickness_in.get()
-        load_input = self.tons_load.get()
-        ap_input = self.ap_mm.get()
-        E_dowel = self.E_dowel.get()
-        E_concrete = self.E_concrete.get()
-        slab_thickness = self.slab_thickness.get()
-        
-        # Convertir unidades según el sistema
-        if self.unit_system.get() == "metric":
-            side_mm = side_input
-            thickness_mm = thickness_input
-            load_kN = load_input
-            ap_mm = ap_input
-            E_d = E_dowel  # MPa
-            E_c = E_concrete  # MPa
-            h_slab = slab_thickness  # mm
-        else:
-            side_mm = side_input * 25.4
-            thickness_mm = thickness_input * 25.4
-            load_kN = load_input * 4.448
-            ap_mm = ap_input * 25.4
-            E_d = E_dowel * 6.895  # ksi a MPa
-            E_c = E_concrete * 6.895  # ksi a MPa
-            h_slab = slab_thickness * 25.4  # in a mm
+        # Convertir unidades con los factores fijos del sistema seleccionado
+        units = inp.units
+        load_kN = inp.tons_load * units.to_kN
         
         # Geometría de la dovela
-        side_in = side_mm / 25.4
-        thickness_in = thickness_mm / 25.4
-        ap_in = ap_mm / 25.4
-        X1 = side_in / np.sqrt(2)  # Semi-diagonal
+        side_in = inp.side_mm * units.to_in
+        thickness_in = inp.thickness_in * units.to_in
+        ap_in = inp.ap_mm * units.to_in
+        h_slab_in = inp.slab_thickness * units.to_in
+        X1 = side_in / _SQRT2  # Semi-diagonal
         
         # Calcular deflexiones usando el modelo FEA existente
         # Encontrar deflexión máxima (lado cargado)
@@ -400,16 +535,15 @@ en juntas de construcción o expansión.
         
         # Parámetros de la dovela para cálculo estándar
         d_dowel = thickness_in  # diámetro en pulgadas
-        E_d_ksi = E_d / 6.895 if self.unit_system.get() == "metric" else E_d
-        E_c_ksi = E_c / 6.895 if self.unit_system.get() == "metric" else E_c
+        E_d_ksi = inp.E_dowel * units.to_ksi
+        E_c_ksi = inp.E_concrete * units.to_ksi
         
         # Rigidez relativa de la dovela
         I_dowel = np.pi * (d_dowel**4) / 64  # Momento de inercia
         
         # Módulo de reacción del concreto (k) - método estándar
         # k = n_h * E_c / (12 * (1 - nu_c^2)) donde n_h es factor de confinamiento
-        nu_c = self.nu_concrete.get()
-        h_slab_in = h_slab / 25.4
+        nu_c = inp.nu_concrete
         k_standard = E_c_ksi * 1000 / (12 * h_slab_in * (1 - nu_c**2))  # pci
         
         # Parámetro característico β (método AASHTO)
@@ -474,25 +608,12 @@ en juntas de construcción o expansión.
         lte_corrected = max(55, min(85, lte_corrected))
         
         # Distribuir LTE en la malla según posición y geometría real
-        lte_values = np.zeros(len(coords))
-        
-        for i, (x, y) in enumerate(coords):
-            # Distancia radial desde el centro de la dovela
-            center_x, center_y = X1 * np.sqrt(3) / 4, X1 / 2  # Centro geométrico
-            radial_distance = np.sqrt((x - center_x)**2 + (y - center_y)**2)
-            max_radius = X1 * 0.6  # Radio efectivo
-            
-            # Factor de atenuación radial más suave
-            if max_radius > 0:
-                distance_factor = 1 - (radial_distance / max_radius)**1.5 * 0.25
-            else:
-                distance_factor = 1.0
-            
-            distance_factor = max(0.7, min(1.0, distance_factor))  # Entre 70% y 100%
-            
-            # LTE local distribuido de forma más realista
-            lte_local = lte_corrected * distance_factor
-            lte_values[i] = max(45, min(90, lte_local))  # Rango físico realista
+        center_x, center_y = X1 * _SQRT3_OVER_4, X1 / 2  # Centro geométrico
+        max_radius = X1 * 0.6  # Radio efectivo
+        xs, ys = coords.T  # Columnas contiguas (SoA) sin copia
+        lte_values = self._lte_kernel(np.ascontiguousarray(xs, dtype=np.float64),
+                                      np.ascontiguousarray(ys, dtype=np.float64),
+                                      center_x, center_y, max_radius, float(lte_corrected))
         
         # LTE promedio corregido
         lte_average = np.mean(lte_values)
@@ -502,36 +623,31 @@ en juntas de construcción o expansión.
         
         return lte_values, lte_average, transferred_force
 
-    def plot_lte_distribution(self, ax, lte_values, coords, triangs, mask_tri):
+    def _get_triangulation(self, coords, triangs, mask_tri=None):
+        """Triangulación de matplotlib reutilizada mientras la malla sea la misma"""
+        cached = self._triang_cache
+        if (cached is not None and cached[0] is coords and cached[1] is triangs
+                and cached[2] is mask_tri):
+            return cached[3]
+        xs, ys = coords.T
+        triang = mtri.Triangulation(xs, ys, triangs)
+        if mask_tri is not None:
+            triang.set_mask(~mask_tri)
+        self._triang_cache = (coords, triangs, mask_tri, triang)
+        return triang
+
+    def plot_lte_distribution(self, ax, lte_values, coords, triangs, mask_tri, inp=None):
         """Plotear distribución de LTE en la dovela"""
+        inp = inp or self._snapshot_inputs()
         
         # Crear triangulación
-        triang = mtri.Triangulation(coords[:, 0], coords[:, 1], triangs)
-        triang.set_mask(~mask_tri)
-        
-        # Definir zonas de LTE con colores claros
-        lte_zones = [
-            (0, 70, 'red', 'Zona Deficiente'),
-            (70, 80, 'orange', 'Zona Marginal'), 
-            (80, 90, 'yellow', 'Zona Aceptable'),
-            (90, 100, 'green', 'Zona Óptima')
-        ]
+        triang = self._get_triangulation(coords, triangs, mask_tri)
         
-        # Crear contornos discretos por zonas
-        levels_deficient = [0, 70]
-        levels_marginal = [70, 80] 
-        levels_acceptable = [80, 90]
-        levels_optimal = [90, 100]
-        
-        # Plotear cada zona con colores específicos
-        if np.any((lte_values >= 0) & (lte_values < 70)):
-            cf1 = ax.tricontourf(triang, lte_values, levels=levels_deficient, colors=['#ff4444'], alpha=0.8, extend='neither')
-        if np.any((lte_values >= 70) & (lte_values < 80)):
-            cf2 = ax.tricontourf(triang, lte_values, levels=levels_marginal, colors=['#ff8800'], alpha=0.8, extend='neither')
-        if np.any((lte_values >= 80) & (lte_values < 90)):
-            cf3 = ax.tricontourf(triang, lte_values, levels=levels_acceptable, colors=['#ffdd00'], alpha=0.8, extend='neither')
-        if np.any(lte_values >= 90):
-            cf4 = ax.tricontourf(triang, lte_values, levels=levels_optimal, colors=['#44aa44'], alpha=0.8, extend='neither')
+        # Plotear todas las zonas en una sola pasada de contorno: cada banda
+        # [0-70, 70-80, 80-90, 90-100] recibe su color; las vacías no se dibujan
+        ax.tricontourf(triang, lte_values, levels=[0, 70, 80, 90, 100],
+                       colors=['#ff4444', '#ff8800', '#ffdd00', '#44aa44'], alpha=0.8, extend='neither',
+                       rasterized=True)
         
         # Contornos de líneas para mostrar niveles
         contour_levels = [70, 80, 90]
@@ -553,9 +669,11 @@ en juntas de construcción o expansión.
         xmin, ymin = coords[imin]
         
         # Calcular posición promedio ponderada por LTE para punto promedio
-        weights = lte_values / np.sum(lte_values)
-        x_avg = np.sum(coords[:, 0] * weights)
-        y_avg = np.sum(coords[:, 1] * weights)
+        # (un producto punto por eje, sin arreglo intermedio de pesos)
+        xs, ys = coords.T
+        lte_sum = lte_values.sum()
+        x_avg = xs @ lte_values / lte_sum
+        y_avg = ys @ lte_values / lte_sum
         
         # CORREGIR: Marcar puntos críticos con símbolos distintivos para LTE
         # LTE Máximo - Flecha azul hacia arriba
@@ -578,54 +696,39 @@ en juntas de construcción o expansión.
                    ha='center', bbox=dict(boxstyle='round,pad=0.3', facecolor='lightcoral', alpha=0.8))
         
         # Dibujar solo el contorno de la dovela sin líneas internas confusas
-        self.add_dovela_outline_only(ax)
+        self.add_dovela_outline_only(ax, inp)
         
         # Obtener unidades correctas y consistentes según el sistema seleccionado
-        side_input = self.side_mm.get()
-        ap_input = self.ap_mm.get()
-        
-        if self.unit_system.get() == "metric":
-            # Sistema métrico - todo en mm
-            side_display = side_input  # mm
-            ap_display = ap_input  # mm
-            unit = "mm"
-            # CORRECCIÓN: Media dovela = (lado × √2) ÷ 2
-            half_diagonal_length = (side_display * np.sqrt(2)) / 2  # 88.39 mm para lado 125
-            
-            # Convertir coordenadas del plot (en pulgadas) a mm para mostrar
-            side_plot = side_input / 25.4  # Para plot interno
-            ap_plot = ap_input / 25.4   # Para plot interno
-        else:
-            # Sistema imperial - todo en pulgadas
-            side_display = side_input  # in
-            ap_display = ap_input  # in
-            unit = "in"
-            half_diagonal_length = (side_display * np.sqrt(2)) / 2  # Media dovela en in
-            
-            # Las coordenadas ya están en pulgadas
-            side_plot = side_input
-            ap_plot = ap_input
+        side_display = inp.side_mm
+        ap_display = inp.ap_mm
+        unit = inp.units.unit_len
+        # CORRECCIÓN: Media dovela = (lado × √2) ÷ 2 (88.39 mm para lado 125)
+        half_diagonal_length = side_display * _SQRT2 / 2
+        
+        # Las coordenadas del plot interno están en pulgadas
+        side_plot = side_display * inp.units.to_in
+        ap_plot = ap_display * inp.units.to_in
         
-        X1 = side_plot / np.sqrt(2)
+        X1 = side_plot / _SQRT2
         
         def y_limits_for_x(xval):
-            if xval < 0 or xval > X1*np.sqrt(3)/2:
+            if xval < 0 or xval > X1*_SQRT3_OVER_2:
                 return None
             y_min = 0
-            y_max = min(X1, -1/np.sqrt(3)*xval + X1/2 + X1/2)
+            y_max = min(X1, -_INV_SQRT3*xval + X1/2 + X1/2)
             if y_max < 0:
                 return None
             return y_min, y_max
         
-        y_joint = y_limits_for_x(ap_plot / np.sqrt(2))
+        y_joint = y_limits_for_x(ap_plot / _SQRT2)
         if y_joint:
-            ax.plot([ap_plot / np.sqrt(2), ap_plot / np.sqrt(2)], [y_joint[0], y_joint[1]], 
+            ax.plot([ap_plot / _SQRT2, ap_plot / _SQRT2], [y_joint[0], y_joint[1]], 
                    ls="-", color="purple", lw=4, alpha=0.9, 
                    label=f"Junta = {ap_display:.1f} {unit}")
         
         ax.set_aspect("equal", "box")
         # Corregir etiquetas de ejes según el sistema de unidades
-        if self.unit_system.get() == "metric":
+        if inp.unit_system == "metric":
             ax.set_xlabel("x [mm equivalente]", fontsize=12)
             ax.set_ylabel("y [mm equivalente]", fontsize=12)
         else:
@@ -634,17 +737,7 @@ en juntas de construcción o expansión.
         ax.set_title("Load Transfer Efficiency (LTE) - Distribución por Zonas", fontsize=14, fontweight='bold')
         ax.grid(True, linestyle='--', alpha=0.3)
         
-        # Crear leyenda completa con zonas y puntos críticos
-        from matplotlib.patches import Patch
-        import matplotlib.lines as mlines
-        
-        # Elementos de la leyenda para zonas
-        legend_zones = [
-            Patch(facecolor='#ff4444', alpha=0.8, label='[D] Deficiente (0-70%)'),
-            Patch(facecolor='#ff8800', alpha=0.8, label='[M] Marginal (70-80%)'),
-            Patch(facecolor='#ffdd00', alpha=0.8, label='[A] Aceptable (80-90%)'),
-            Patch(facecolor='#44aa44', alpha=0.8, label='[O] Optima (90-100%)')
-        ]
+        # Crear leyenda completa con zonas (parches fijos) y puntos críticos
         
         # Elementos de la leyenda para puntos críticos
         legend_points = [
@@ -660,7 +753,7 @@ en juntas de construcción o expansión.
         ]
         
         # Combinar elementos de leyenda
-        all_legend_elements = legend_zones + legend_points
+        all_legend_elements = LTE_LEGEND_PATCHES + legend_points
         
         # Colocar leyenda en posición óptima con múltiples columnas
         ax.legend(handles=all_legend_elements, loc="upper right", fontsize=8, 
@@ -669,25 +762,16 @@ en juntas de construcción o expansión.
         
         # Panel de información técnica mejorado
         # Calcular distribución porcentual por zonas
-        total_points = len(lte_values[lte_values > 0])
-        zona_optima = np.sum((lte_values >= 90) & (lte_values > 0)) / total_points * 100
-        zona_aceptable = np.sum((lte_values >= 80) & (lte_values < 90)) / total_points * 100
-        zona_marginal = np.sum((lte_values >= 70) & (lte_values < 80)) / total_points * 100
-        zona_deficiente = np.sum((lte_values >= 0) & (lte_values < 70)) / total_points * 100
+        # (un solo recorrido: índice de zona por nodo y conteo por zona; el
+        # kernel LTE acota los valores a 45-90%, así que no hay nodos en cero)
+        zone_counts = np.bincount(np.digitize(lte_values, [0, 70, 80, 90]), minlength=5)
+        total_points = zone_counts[1:].sum()
+        zona_deficiente, zona_marginal, zona_aceptable, zona_optima = zone_counts[1:] / total_points * 100
         
         # Evaluación automática del rendimiento
-        if lte_average >= 90:
-            evaluacion = "EXCELENTE"
-            color_eval = "green"
-        elif lte_average >= 80:
-            evaluacion = "BUENO"
-            color_eval = "darkgreen"
-        elif lte_average >= 70:
-            evaluacion = "ACEPTABLE"
-            color_eval = "orange"
-        else:
-            evaluacion = "DEFICIENTE"
-            color_eval = "red"
+        rating = _lte_rating(lte_average)
+        evaluacion = rating.label
+        color_eval = rating.color
         
         info_text = f"""METRICAS LTE:
 • Aceptable: {zona_aceptable:.0f}%
@@ -713,65 +797,48 @@ GEOMETRIA:
                         alpha=0.8, edgecolor='black'),
                color='white')
 
-    def add_dovela_outline_only(self, ax):
+    def add_dovela_outline_only(self, ax, inp=None):
         """Agregar solo el contorno de la dovela sin líneas internas"""
-        side_input = self.side_mm.get()
-        
-        if self.unit_system.get() == "metric":
-            side_in = side_input / 25.4
-        else:
-            side_in = side_input
-            
-        X1 = side_in / np.sqrt(2)
+        inp = inp or self._snapshot_inputs()
+        side_in = inp.side_mm * inp.units.to_in
+        X1 = side_in / _SQRT2
         
         # Solo contorno del triángulo (forma de dovela)
         v0 = np.array([0, 0])
         v1 = np.array([0, X1])
-        v2 = np.array([X1*np.sqrt(3)/2, X1/2])
+        v2 = np.array([X1*_SQRT3_OVER_2, X1/2])
         triangle_pts = np.array([v0, v1, v2, v0])
         ax.plot(triangle_pts[:, 0], triangle_pts[:, 1], color="black", lw=3, alpha=0.9)
 
-    def plot_lte_profile(self, ax, mesh, lte_values, coords):
+    def plot_lte_profile(self, ax, lte_values, coords, triangs, mask_tri, inp=None):
         """GRÁFICA SIMPLIFICADA: Perfil LTE a lo largo de la MEDIA dovela"""
+        inp = inp or self._snapshot_inputs()
         
         # Obtener parámetros y calcular MEDIA DOVELA correcta
-        side_input = self.side_mm.get()
-        ap_input = self.ap_mm.get()
-        
-        if self.unit_system.get() == "metric":
-            side_display = side_input
-            ap_display = ap_input
-            unit = "mm"
-            # CORRECCIÓN FUNDAMENTAL: Media dovela = (lado × √2) ÷ 2
-            half_diagonal_length = (side_display * np.sqrt(2)) / 2  # 88.39 mm para 125 mm
-        else:
-            side_display = side_input
-            ap_display = ap_input
-            unit = "in"
-            half_diagonal_length = (side_display * np.sqrt(2)) / 2
+        side_display = inp.side_mm
+        ap_display = inp.ap_mm
+        unit = inp.units.unit_len
+        # CORRECCIÓN FUNDAMENTAL: Media dovela = (lado × √2) ÷ 2 (88.39 mm para 125 mm)
+        half_diagonal_length = side_display * _SQRT2 / 2
         
         # Crear puntos a lo largo de la MEDIA DOVELA
         n_points = 50
         distances = np.linspace(0, half_diagonal_length, n_points)
         
-        # Convertir coordenadas del mesh a unidades del usuario
-        if self.unit_system.get() == "metric":
-            coords_user = coords * 25.4  # in a mm
-        else:
-            coords_user = coords  # ya en in
-        
-        # Definir línea principal a lo largo de la dovela (eje X)
-        diagonal_points_user = []
-        for dist in distances:
-            # Mapear distancia a coordenadas X, Y = 0 (línea central)
-            x_coord = dist * np.sqrt(2)  # Proyección en X
-            y_coord = 0  # Línea central
-            diagonal_points_user.append([x_coord, y_coord])
+        # Factor de unidades del usuario a las del mesh (in)
+        user_to_mesh = inp.units.to_in
         
-        diagonal_points_user = np.array(diagonal_points_user)
+        # Línea principal a lo largo de la dovela (eje X, línea central Y = 0),
+        # ya en unidades del mesh
+        x_line = distances * _SQRT2 * user_to_mesh  # Proyección en X
+        y_line = np.zeros_like(x_line)
         
-        # Interpolar valores LTE en los puntos de la línea
-        lte_diagonal = griddata(coords_user, lte_values, diagonal_points_user, method='linear', fill_value=0)
+        # Interpolar valores LTE sobre la triangulación FE (sin re-triangular con qhull;
+        # se reutiliza la triangulación enmascarada de los demás gráficos);
+        # fuera del dominio (apertura de junta o fuera del diamante) se usa 0
+        triang = self._get_triangulation(coords, triangs, mask_tri)
+        interp = mtri.LinearTriInterpolator(triang, lte_values)
+        lte_diagonal = interp(x_line, y_line).filled(0)
         
         # Filtrar valores válidos
         valid_mask = ~np.isnan(lte_diagonal) & (lte_diagonal >= 0)
@@ -781,15 +848,12 @@ GEOMETRIA:
         # GRÁFICA SIMPLIFICADA Y CLARA
         
         # 1. Fondo con zonas de color horizontales
-        ax.axhspan(0, 70, alpha=0.2, color='red', label='Zona Deficiente (0-70%)')
-        ax.axhspan(70, 80, alpha=0.2, color='orange', label='Zona Marginal (70-80%)')
-        ax.axhspan(80, 90, alpha=0.2, color='yellow', label='Zona Aceptable (80-90%)')
-        ax.axhspan(90, 100, alpha=0.2, color='green', label='Zona Óptima (90-100%)')
+        for lo, hi, color, label in LTE_PROFILE_BANDS:
+            ax.axhspan(lo, hi, alpha=0.2, color=color, label=label, rasterized=True)
         
         # 2. Líneas de referencia
-        ax.axhline(y=70, color='red', linestyle='--', linewidth=2, alpha=0.8)
-        ax.axhline(y=80, color='orange', linestyle='--', linewidth=2, alpha=0.8)
-        ax.axhline(y=90, color='green', linestyle='--', linewidth=2, alpha=0.8)
+        for level, color in LTE_REFERENCE_LINES:
+            ax.axhline(y=level, color=color, linestyle='--', linewidth=2, alpha=0.8)
         
         # 3. Plot principal del LTE
         if len(distances_valid) > 0:
@@ -797,19 +861,11 @@ GEOMETRIA:
             ax.plot(distances_valid, lte_diagonal_valid, 'navy', linewidth=4, 
                    label='LTE a lo largo de la media dovela', marker='o', markersize=5)
             
-            # Puntos coloreados según zona
-            for i, (dist, lte_val) in enumerate(zip(distances_valid, lte_diagonal_valid)):
-                if lte_val >= 90:
-                    color = 'darkgreen'
-                elif lte_val >= 80:
-                    color = 'gold'
-                elif lte_val >= 70:
-                    color = 'orange'
-                else:
-                    color = 'red'
-                
-                ax.scatter(dist, lte_val, c=color, s=80, edgecolors='black', 
-                          linewidth=1, alpha=0.9, zorder=10)
+            # Puntos coloreados según zona (un solo artista para toda la línea)
+            point_colors = np.select([lte_diagonal_valid >= 90, lte_diagonal_valid >= 80, lte_diagonal_valid >= 70],
+                                     ['darkgreen', 'gold', 'orange'], default='red')
+            ax.scatter(distances_valid, lte_diagonal_valid, c=point_colors, s=80, edgecolors='black', 
+                      linewidth=1, alpha=0.9, zorder=10, rasterized=True)
         
         # 4. Marcar posición de junta
         if ap_display <= half_diagonal_length:
@@ -831,11 +887,9 @@ GEOMETRIA:
             lte_max = np.max(lte_diagonal_valid)
             lte_min = np.min(lte_diagonal_valid)
             
-            # Calcular porcentajes por zona
-            optimal_pct = np.sum(lte_diagonal_valid >= 90) / len(lte_diagonal_valid) * 100
-            acceptable_pct = np.sum((lte_diagonal_valid >= 80) & (lte_diagonal_valid < 90)) / len(lte_diagonal_valid) * 100
-            marginal_pct = np.sum((lte_diagonal_valid >= 70) & (lte_diagonal_valid < 80)) / len(lte_diagonal_valid) * 100
-            deficient_pct = np.sum(lte_diagonal_valid < 70) / len(lte_diagonal_valid) * 100
+            # Calcular porcentajes por zona (<70, 70-80, 80-90, >=90) en una pasada
+            zone_counts = np.bincount(np.digitize(lte_diagonal_valid, [70, 80, 90]), minlength=4)
+            deficient_pct, marginal_pct, acceptable_pct, optimal_pct = zone_counts / len(lte_diagonal_valid) * 100
             
             stats_text = f"""Estadísticas Media Dovela:
 Promedio: {lte_mean:.1f}%
@@ -883,32 +937,18 @@ Distribución:
         # Esta función ya no es necesaria con la nueva visualización simplificada
         pass
 
-    def show_lte_summary(self, lte_average, transfer_force, lte_values):
+    def show_lte_summary(self, lte_average, transfer_force, lte_values, inp=None):
         """Mostrar resumen detallado del análisis LTE"""
+        inp = inp or self._snapshot_inputs()
         
-        # Obtener parámetros del análisis
-        load_input = self.tons_load.get()
-        side_input = self.side_mm.get()
-        thickness_input = self.thickness_in.get()
-        ap_input = self.ap_mm.get()
-        
-        # Convertir unidades para mostrar
-        if self.unit_system.get() == "metric":
-            load_display = load_input
-            load_unit = "kN"
-            transfer_display = transfer_force
-            side_display = side_input
-            thickness_display = thickness_input
-            ap_display = ap_input
-            dim_unit = "mm"
-        else:
-            load_display = load_input
-            load_unit = "tons"
-            transfer_display = transfer_force / 4.448  # kN a tons
-            side_display = side_input
-            thickness_display = thickness_input
-            ap_display = ap_input
-            dim_unit = "in"
+        # Parámetros del análisis en las unidades del usuario
+        load_display = inp.tons_load
+        load_unit = inp.units.unit_load
+        transfer_display = transfer_force / inp.units.to_kN  # kN a unidades del usuario
+        side_display = inp.side_mm
+        thickness_display = inp.thickness_in
+        ap_display = inp.ap_mm
+        dim_unit = inp.units.unit_len
         
         # Calcular estadísticas
         valid_lte = lte_values[lte_values > 0]
@@ -917,18 +957,9 @@ Distribución:
         lte_std = np.std(valid_lte) if len(valid_lte) > 0 else 0
         
         # Evaluación del LTE
-        if lte_average >= 90:
-            lte_evaluation = "✅ EXCELENTE - Transferencia óptima"
-            lte_status = "🟢"
-        elif lte_average >= 80:
-            lte_evaluation = "⚠️ ACEPTABLE - Transferencia adecuada"
-            lte_status = "🟡"
-        elif lte_average >= 70:
-            lte_evaluation = "⚠️ MARGINAL - Necesita mejoras"
-            lte_status = "🟠"
-        else:
-            lte_evaluation = "❌ DEFICIENTE - Rediseñar sistema"
-            lte_status = "🔴"
+        rating = _lte_rating(lte_average)
+        lte_evaluation = rating.evaluation
+        lte_status = rating.status
         
         # Calcular eficiencia relativa
         theoretical_max_lte = 95  # LTE teórico máximo práctico
@@ -962,7 +993,7 @@ Distribución:
 ⚡ TRANSFERENCIA DE CARGA:
 • Carga transferida: {transfer_display:.1f} {load_unit} ({lte_average:.1f}%)
 • Carga no transferida: {lost_load:.1f} {load_unit} ({100-lte_average:.1f}%)
-• Efectividad del sistema: {"Óptima" if lte_average >= 90 else "Adecuada" if lte_average >= 80 else "Mejorable"}
+• Efectividad del sistema: {rating.effectiveness}
 
 🎯 CRITERIOS DE EVALUACIÓN:
 • > 90%: ✅ Transferencia excelente - Sistema óptimo
@@ -971,7 +1002,7 @@ Distribución:
 • < 70%: ❌ Transferencia deficiente - Rediseño necesario
 
 💡 RECOMENDACIONES DE DISEÑO:
-• {"Diseño óptimo - Mantener configuración" if lte_average >= 90 else "Incrementar diámetro de dovela" if lte_average >= 80 else "Reducir espaciamiento entre dovelas" if lte_average >= 70 else "Rediseñar completamente el sistema"}
+• {rating.recommendation}
 • {"Considerar dovelas adicionales" if lte_average < 85 else "Sistema eficiente"}
 • {"Verificar anclaje en concreto" if lte_average < 75 else "Anclaje adecuado"}
 
@@ -982,8 +1013,8 @@ Distribución:
 
 📋 CONCLUSIONES:
 La dovela presenta un LTE de {lte_average:.1f}%, lo que indica una transferencia de carga 
-{"excelente" if lte_average >= 90 else "aceptable" if lte_average >= 80 else "mejorable" if lte_average >= 70 else "deficiente"}.
-{"El sistema funciona óptimamente." if lte_average >= 90 else "Se recomienda monitoreo del desempeño." if lte_average >= 80 else "Se sugieren mejoras al diseño." if lte_average >= 70 else "Es necesario rediseñar el sistema de transferencia."}
+{rating.level}.
+{rating.conclusion}
         """
         
         messagebox.showinfo("📊 Análisis Load Transfer Efficiency (LTE)", summary)
@@ -992,66 +1023,47 @@ La dovela presenta un LTE de {lte_average:.1f}%, lo que indica una transferencia
         """Ejecutar análisis de esfuerzos específico"""
         try:
             # Calcular los resultados base
-            mesh, w_vals, coords, triangs, mask_tri = self.calculate_base_results()
-            
-            # Crear figura individual
-            fig, ax = plt.subplots(figsize=(10, 8))
+            inp = self._snapshot_inputs()
+            mesh, w_vals, coords, triangs, mask_tri = self.calculate_base_results(inp)
             
+            stresses = self._compute_all_stresses(mesh, w_vals, coords, inp)
             if stress_type == "von_mises":
-                stress_vals = self.calculate_von_mises_stress(mesh, w_vals, coords)
+                stress_vals = stresses.von_mises
                 title = "Esfuerzo von Mises (Criterio de Falla)"
                 colormap = "plasma"
                 unit = "ksi"
             elif stress_type == "principal":
-                stress_p1, stress_p2 = self.calculate_principal_stresses(mesh, w_vals, coords)
-                stress_vals = stress_p1
+                stress_vals = stresses.principal_max
                 title = "Esfuerzo Principal Máximo (Tensión Máxima)"
                 colormap = "viridis"
                 unit = "ksi"
             elif stress_type == "shear":
-                stress_p1, stress_p2 = self.calculate_principal_stresses(mesh, w_vals, coords)
-                stress_vals = self.calculate_shear_stress(stress_p1, stress_p2)
+                stress_vals = stresses.shear
                 title = "Esfuerzo Cortante Máximo (Corte)"
                 colormap = "coolwarm"
                 unit = "ksi"
             
-            self.plot_stress_contour(ax, stress_vals, coords, triangs, mask_tri, title, colormap, unit)
+            # Reutilizar la figura de resultados
+            ax = self._results_figure(title, figsize=(10, 8))
+            self.plot_stress_contour(ax, stress_vals.astype(PLOT_DTYPE), coords, triangs, mask_tri, title, colormap, unit, inp=inp)
             
-            plt.tight_layout()
-            plt.show()
+            self._draw_results()
             
         except Exception as e:
             tb = traceback.format_exc()
             messagebox.showerror("Error", f"{str(e)}\n\n{tb}")
 
-    def calculate_base_results(self):
+    def calculate_base_results(self, inp=None):
         """Calcular resultados base (geometría, malla, deflexiones)"""
-        # Validaciones de entrada
-        side_input = self.side_mm.get()
-        thickness_input = self.thickness_in.get()
-        load_input = self.tons_load.get()
-        ap_input = self.ap_mm.get()
-        loaded_side = self.loaded_side.get()
-        E_dowel = self.E_dowel.get()
-        nu_dowel = self.nu_dowel.get()
-
-        # Conversión de unidades según el sistema seleccionado
-        if self.unit_system.get() == "metric":
-            # Sistema SI - convertir a unidades de trabajo (in, ksi)
-            side_mm = side_input  # mm
-            thickness_in = thickness_input / 25.4  # mm a in
-            tons_load = load_input / 4.448  # kN a tons (US)
-            ap_mm = ap_input  # mm
-            E = E_dowel / 6.895  # MPa a ksi
-            nu = nu_dowel
-        else:
-            # Sistema Imperial - usar directamente
-            side_mm = side_input * 25.4  # in a mm
-            thickness_in = thickness_input  # in
-            tons_load = load_input  # tons
-            ap_mm = ap_input * 25.4  # in a mm
-            E = E_dowel  # ksi
-            nu = nu_dowel
+        inp = inp or self._snapshot_inputs()
+        # Conversión a unidades de trabajo (in, tons, ksi; lados en mm)
+        units = inp.units
+        side_mm = inp.side_mm * units.to_mm
+        thickness_in = inp.thickness_in * units.to_in
+        tons_load = inp.tons_load * units.to_tons
+        ap_mm = inp.ap_mm * units.to_mm
+        E = inp.E_dowel * units.to_ksi
+        nu = inp.nu_dowel
 
         # Validaciones
         if side_mm <= 0:
@@ -1072,7 +1084,7 @@ La dovela presenta un LTE de {lte_average:.1f}%, lo que indica una transferencia
         # Conversiones y pre-cálculos
         q_total = tons_load * 2.20462
         side_in = side_mm / 25.4
-        X1 = side_in / np.sqrt(2)  # Semi-diagonal
+        X1 = side_in / _SQRT2  # Semi-diagonal
         D = E * thickness_in ** 3 / (12 * (1 - nu ** 2))
         ap = ap_mm / 25.4  # Apertura de junta en pulgadas
         delta0, delta1 = 0.22, 0.05
@@ -1084,67 +1096,85 @@ La dovela presenta un LTE de {lte_average:.1f}%, lo que indica una transferencia
         if ap == 0 or np.isclose(ap, X1):
             raise ValueError("La apertura de junta no puede ser cero ni igual a la semidiagonal.")
         
-        n_points = 60  # Densidad para contornos suaves
+        # Reutilizar la solución si las entradas (ya convertidas) no cambiaron
+        key = (side_mm, thickness_in, tons_load, ap_mm, E, nu)
+        cached = self._fem_cache.get(key)
+        if cached is not None:
+            return cached
         
-        # Definir vértices del diamante completo
-        diamond_vertices = [
-            np.array([0, X1]),      # Vértice superior
-            np.array([X1, 0]),      # Vértice derecho
-            np.array([0, -X1]),     # Vértice inferior
-            np.array([-X1, 0])      # Vértice izquierdo
-        ]
+        mesh, basis, w_unit, mask_tri = self._assemble_geometry(X1, ap)
+        
+        # K = D * K0 y b = f_body * b_unit: la deflexión es lineal en f_body / D,
+        # así que carga, E, nu y espesor solo escalan la solución unitaria cacheada
+        w_sol = w_unit * (f_body / D)
+        w = basis.zeros()
+        w[basis.nodal_dofs] = w_sol
 
-        # Generar puntos dentro del diamante completo
-        x_range = np.linspace(-X1, X1, n_points)
-        y_range = np.linspace(-X1, X1, n_points)
-        xx, yy = np.meshgrid(x_range, y_range)
-        points = np.column_stack((xx.flatten(), yy.flatten()))
-
-        def is_in_diamond(p):
-            """Verificar si un punto está dentro del diamante"""
-            x, y = p
-            return (abs(x) + abs(y)) <= X1
-
-        def is_in_joint_opening(p):
-            """Verificar si un punto está en la apertura de junta"""
-            x, y = p
-            return abs(x) <= (ap / 2)
-
-        # Filtrar puntos: dentro del diamante pero fuera de la apertura de junta
-        mask = np.array([is_in_diamond(p) and not is_in_joint_opening(p) for p in points])
-        filtered_points = points[mask]
-        
-        # Agregar vértices del diamante si no están presentes
-        def add_vertex_if_missing(pts, vertex):
-            if not np.any(np.all(np.isclose(pts, vertex, atol=1e-8), axis=1)):
-                pts = np.vstack([pts, vertex])
-            return pts
-        
-        for vertex in diamond_vertices:
-            if not is_in_joint_opening(vertex):
-                filtered_points = add_vertex_if_missing(filtered_points, vertex)
-        
-        # Agregar puntos en los bordes de la apertura de junta
-        joint_edge_points = [
-            np.array([ap/2, X1*0.9]),    # Borde derecho superior
-            np.array([ap/2, -X1*0.9]),   # Borde derecho inferior
-            np.array([-ap/2, X1*0.9]),   # Borde izquierdo superior
-            np.array([-ap/2, -X1*0.9])   # Borde izquierdo inferior
-        ]
+        # coords es la vista transpuesta de mesh.p (2, N): cada columna es un
+        # arreglo 1-D contiguo, así que coords.T da xs, ys (SoA) sin copiar
+        coords = mesh.p.T
+        triangs = mesh.t.T
+        w_vals = w
+        w_vals.flags.writeable = False
+
+        result = (mesh, w_vals, coords, triangs, mask_tri)
+        if len(self._fem_cache) >= FEM_CACHE_SIZE:
+            self._fem_cache.pop(next(iter(self._fem_cache)))
+        self._fem_cache[key] = result
+        return result
+
+    def _assemble_geometry(self, X1, ap):
+        """Malla, base y solución para D = 1 y carga unitaria (cacheadas por geometría)"""
+        key = (X1, ap)
+        cached = self._geometry_cache.get(key)
+        if cached is not None:
+            return cached
+        
+        n_points = 60  # Densidad para contornos suaves
         
-        for point in joint_edge_points:
-            if is_in_diamond(point):
-                filtered_points = add_vertex_if_missing(filtered_points, point)
+        # Puntos de la rejilla dentro del diamante pero fuera de la apertura de junta:
+        # la condición se evalúa sobre el eje 1-D (filas = y, columnas = x) y solo
+        # se construyen las coordenadas de los puntos que quedan, en el mismo orden
+        grid = np.linspace(-X1, X1, n_points)
+        grid_abs = np.abs(grid)
+        in_diamond = (grid_abs[:, None] + grid_abs[None, :]) <= X1
+        in_joint = grid_abs <= (ap / 2)
+        rows, cols = np.nonzero(in_diamond & ~in_joint[None, :])
+        filtered_points = np.column_stack((grid[cols], grid[rows]))
+        
+        # Candidatos a vértice: los 4 del diamante (si quedan fuera de la junta)
+        # y 4 puntos en los bordes de la apertura (si quedan dentro del diamante)
+        candidates = np.array([
+            [0, X1],                # Vértice superior
+            [X1, 0],                # Vértice derecho
+            [0, -X1],               # Vértice inferior
+            [-X1, 0],               # Vértice izquierdo
+            [ap/2, X1*0.9],         # Borde derecho superior
+            [ap/2, -X1*0.9],        # Borde derecho inferior
+            [-ap/2, X1*0.9],        # Borde izquierdo superior
+            [-ap/2, -X1*0.9]        # Borde izquierdo inferior
+        ])
+        cx_abs = np.abs(candidates[:, 0])
+        wanted = np.concatenate([~(cx_abs[:4] <= (ap / 2)),
+                                 (cx_abs[4:] + np.abs(candidates[4:, 1])) <= X1])
+        
+        # Una sola comparación difusa de todos los candidatos contra la nube
+        # (misma tolerancia de np.isclose que la búsqueda punto a punto)
+        present = np.isclose(filtered_points[:, None, :], candidates, atol=1e-8).all(axis=2).any(axis=0)
+        missing = wanted & ~present
+        # Un candidato igual a otro anterior que ya se agrega no se repite
+        same = np.isclose(candidates[:, None, :], candidates, atol=1e-8).all(axis=2)
+        missing &= ~(np.triu(same, 1) & missing[:, None]).any(axis=0)
+        filtered_points = np.vstack([filtered_points, candidates[missing]])
         
         # Crear triangulación
         tri = mtri.Triangulation(filtered_points[:, 0], filtered_points[:, 1])
 
-        def triangle_in_domain(triangle, pts):
-            """Verificar si un triángulo está completamente en el dominio"""
-            triangle_points = pts[triangle]
-            return all(is_in_diamond(p) and not is_in_joint_opening(p) for p in triangle_points)
-        
-        mask_tri = np.array([triangle_in_domain(tri, filtered_points) for tri in tri.triangles])
+        # Un triángulo está en el dominio si sus tres vértices lo están
+        # (máscara por punto, incluidos los vértices agregados, indexada por triángulo)
+        fx_abs = np.abs(filtered_points[:, 0])
+        point_in_domain = ((fx_abs + np.abs(filtered_points[:, 1])) <= X1) & ~(fx_abs <= (ap / 2))
+        mask_tri = point_in_domain[tri.triangles].all(axis=1)
         tri.set_mask(~mask_tri)
 
         points = filtered_points.T
@@ -1161,321 +1191,168 @@ La dovela presenta un LTE de {lte_average:.1f}%, lo que indica una transferencia
         
         @BilinearForm
         def a(u, v, w):
-            return D * dot(grad(u), grad(v))
+            # Rigidez con D = 1; la rigidez real D se aplica al escalar la solución
+            return dot(grad(u), grad(v))
         @LinearForm
         def f(v, w):
-            return f_body * v
+            return v
             
-        A = asm(a, basis)
-        b = asm(f, basis)
+        # Ensamblar directamente con cada forma (sin el despacho genérico de asm)
+        A = a.assemble(basis)
+        b_unit = f.assemble(basis)
         
         # Condiciones de frontera mejoradas para dovela diamante
         boundary_facets = mesh.boundary_facets()
         boundary_nodes = np.unique(mesh.facets[:, boundary_facets])
         
-        # Identificar nodos en la apertura de junta (condiciones de frontera especiales)
-        joint_boundary_nodes = []
-        coords = mesh.p.T
+        # Identificar nodos en la apertura de junta (condiciones de frontera especiales):
+        # nodos en los bordes de la apertura, seleccionados con una sola máscara
+        x, y = mesh.p
         tolerance = ap * 0.1
-        
-        for i, coord in enumerate(coords):
-            x, y = coord
-            # Nodos en los bordes de la apertura de junta
-            if abs(abs(x) - ap/2) < tolerance and abs(y) < X1:
-                joint_boundary_nodes.append(i)
-        
-        joint_boundary_nodes = np.array(joint_boundary_nodes, dtype=int)
+        joint_mask = (np.abs(np.abs(x) - ap/2) < tolerance) & (np.abs(y) < X1)
+        joint_boundary_nodes = np.flatnonzero(joint_mask)
         
         # Combinar todos los nodos de frontera
         all_boundary_nodes = np.unique(np.concatenate([boundary_nodes, joint_boundary_nodes]))
         
         dofs = basis.get_dofs(nodes=all_boundary_nodes)
-        system = condense(A, b, D=dofs)
-        w_sol = solve(*system)
-        w = basis.zeros()
-        w[basis.nodal_dofs] = w_sol
-
-        coords = mesh.p.T
-        triangs = mesh.t.T
-        w_vals = w
-
-        return mesh, w_vals, coords, triangs, mask_tri
-                v0 = b - a
-                v1 = c - a
-                v2 = p - a
-                d00 = np.dot(v0, v0)
-                d01 = np.dot(v0, v1)
-                d11 = np.dot(v1, v1)
-                d20 = np.dot(v2, v0)
-                d21 = np.dot(v2, v1)
-                denom = d00 * d11 - d01 * d01
-                v = (d11 * d20 - d01 * d21) / denom
-                w = (d00 * d21 - d01 * d20) / denom
-                u = 1 - v - w
-                return u, v, w
-            u, v, w = barycentric(p, v0, v1, v2)
-            return (u >= 0) and (v >= 0) and (w >= 0)
-
-        mask = np.array([is_in_triangle(p) for p in points])
-        filtered_points = points[mask]
-        
-        def add_vertex_if_missing(pts, vertex):
-            if not np.any(np.all(np.isclose(pts, vertex, atol=1e-8), axis=1)):
-                pts = np.vstack([pts, vertex])
-            return pts
-        filtered_points = add_vertex_if_missing(filtered_points, v0)
-        filtered_points = add_vertex_if_missing(filtered_points, v1)
-        filtered_points = add_vertex_if_missing(filtered_points, v2)
-        
-        tri = mtri.Triangulation(filtered_points[:, 0], filtered_points[:, 1])
-
-        def triangle_in_domain(triangle, pts):
-            return all(is_in_triangle(pts[v]) for v in triangle)
-        mask_tri = np.array([triangle_in_domain(tri, filtered_points) for tri in tri.triangles])
-        tri.set_mask(~mask_tri)
-
-        points = filtered_points.T
-        triangles = tri.triangles[mask_tri].T
-
-        mesh = MeshTri(points, triangles)
-        
-        if points.shape[1] == 0 or triangles.shape[1] == 0:
-            raise ValueError("No se pudo generar una malla válida.")
-
-        # Resolver problema de deflexión
-        elem = ElementTriP1()
-        basis = Basis(mesh, elem)
-        
-        @BilinearForm
-        def a(u, v, w):
-            return D * dot(grad(u), grad(v))
-        @LinearForm
-        def f(v, w):
-            return f_body * v
-            
-        A = asm(a, basis)
-        b = asm(f, basis)
-        
-        boundary_facets = mesh.boundary_facets()
-        boundary_nodes = np.unique(mesh.facets[:, boundary_facets])
-        
-        dofs = basis.get_dofs(nodes=boundary_nodes)
-        system = condense(A, b, D=dofs)
-        w_sol = solve(*system)
-        w = basis.zeros()
-        w[basis.nodal_dofs] = w_sol
-
-        coords = mesh.p.T
+        A_c, b_c, _, interior = condense(A, b_unit, D=dofs)
+        w_unit = basis.zeros()
+        w_unit[interior] = splu(A_c.tocsc()).solve(b_c)
+        w_unit.flags.writeable = False
+
+        result = (mesh, basis, w_unit, mask_tri)
+        if len(self._geometry_cache) >= FEM_CACHE_SIZE:
+            self._geometry_cache.pop(next(iter(self._geometry_cache)))
+        self._geometry_cache[key] = result
+        return result
+
+    def _element_plate_stresses(self, mesh, w_vals, coords, inp=None):
+        """Esfuerzos de placa (sigma_x, sigma_y, tau_xy) por elemento, vectorizados"""
+        inp = inp or self._snapshot_inputs()
+        # Convertir a unidades de trabajo (ksi, in)
+        E = inp.E_dowel * inp.units.to_ksi
+        nu = inp.nu_dowel
+        thickness_in = inp.thickness_in * inp.units.to_in
+        
+        # Coordenadas y deflexiones de todos los elementos: (n_elem, 3)
         triangs = mesh.t.T
-        w_vals = w
-
-        return mesh, w_vals, coords, triangs, mask_tri
-
-    def calculate_von_mises_stress(self, mesh, w_vals, coords):
+        xs, ys = coords.T
+        x_elem = xs[triangs]
+        y_elem = ys[triangs]
+        w_elem = w_vals[triangs]
+        
+        # Matriz B para elemento triangular lineal (b_i, c_i de cada vértice)
+        b = y_elem[:, [1, 2, 0]] - y_elem[:, [2, 0, 1]]
+        c = x_elem[:, [2, 0, 1]] - x_elem[:, [1, 2, 0]]
+        
+        # Área del elemento; se descartan elementos degenerados
+        two_area = np.abs(b[:, 2] * c[:, 1] - b[:, 1] * c[:, 2])
+        valid = two_area > 2e-12
+        
+        # Gradientes de deflexión
+        dwdx = np.divide(np.einsum('ij,ij->i', b, w_elem), two_area, out=np.zeros(len(triangs)), where=valid)
+        dwdy = np.divide(np.einsum('ij,ij->i', c, w_elem), two_area, out=np.zeros(len(triangs)), where=valid)
+        
+        # Curvaturas aproximadas (kxy = 0: simplificación para triángulos lineales)
+        factor = 12.0 / (thickness_in ** 2)
+        kx = -dwdx * factor
+        ky = -dwdy * factor
+        
+        # Esfuerzos usando teoría de placas, con la escala empírica ajustada
+        # (E / 10000) ya incluida para que los nodos reciban el valor final
+        D_coeff = E / (1 - nu * nu) * (E / 10000.0)
+        sigma_x = D_coeff * (kx + nu * ky)
+        sigma_y = D_coeff * (ky + nu * kx)
+        tau_xy = np.zeros_like(sigma_x)
+        
+        return triangs, sigma_x, sigma_y, tau_xy, valid, two_area
+
+    def _compute_all_stresses(self, mesh, w_vals, coords, inp=None):
+        """von Mises, principales y cortante a partir de un solo cálculo de esfuerzos"""
+        inp = inp or self._snapshot_inputs()
+        # Reutilizar los campos si la solución (misma instancia cacheada) y el
+        # material no cambiaron: los botones de esfuerzo comparten un solo cálculo
+        params = (inp.E_dowel, inp.nu_dowel, inp.thickness_in, inp.units)
+        cached = self._stress_cache
+        if cached is not None and cached[0] is w_vals and cached[1] == params:
+            return cached[2]
+        
+        triangs, sigma_x, sigma_y, tau_xy, valid, two_area = self._element_plate_stresses(mesh, w_vals, coords, inp)
+        n_nodes = len(coords)
+        
+        # Invariantes por elemento compartidos por todos los campos
+        s_avg = (sigma_x + sigma_y) * 0.5
+        s_diff = (sigma_x - sigma_y) * 0.5
+        s_radius = np.sqrt(s_diff**2 + tau_xy**2)
+        
+        # von Mises por elemento (0 en elementos degenerados o valores no válidos)
+        vm_squared = sigma_x**2 + sigma_y**2 - sigma_x*sigma_y + 3*tau_xy**2
+        element_stresses = np.sqrt(vm_squared, out=np.zeros_like(vm_squared),
+                                   where=valid & (vm_squared >= 0))
+        
+        # Interpolar de elementos a nodos: promedio ponderado por área de los
+        # elementos (finitos) que contienen cada nodo, en una sola pasada de
+        # scatter (el área doble ya se calculó para los gradientes)
+        finite = np.isfinite(element_stresses)
+        nodes = triangs[finite].ravel()
+        area_weights = np.repeat(two_area[finite], 3)
+        total_stress = np.bincount(nodes, weights=np.repeat(element_stresses[finite], 3) * area_weights,
+                                   minlength=n_nodes)
+        total_weight = np.bincount(nodes, weights=area_weights, minlength=n_nodes)
+        stress_vm = np.divide(total_stress, total_weight, out=np.zeros(n_nodes),
+                              where=total_weight > 0)
+        
+        # Esfuerzos principales por elemento
+        p1_elem = s_avg + s_radius
+        p2_elem = s_avg - s_radius
+        
+        # Asignar a nodos: máximo |p1| y mínimo p2 de los elementos que los contienen
+        ok = valid & np.isfinite(p1_elem) & np.isfinite(p2_elem)
+        nodes = triangs[ok].ravel()
+        stress_p1 = np.zeros(n_nodes)
+        stress_p2 = np.zeros(n_nodes)
+        np.maximum.at(stress_p1, nodes, np.repeat(np.abs(p1_elem[ok]), 3))
+        np.minimum.at(stress_p2, nodes, np.repeat(p2_elem[ok], 3))
+        
+        # Limpiar valores no válidos sobre los mismos arreglos (son nuevos y aún
+        # no se comparten); la escala ya viene aplicada desde D_coeff
+        for field in (stress_vm, stress_p1, stress_p2):
+            field[~np.isfinite(field)] = 0.0
+        
+        fields = StressFields(stress_vm, stress_p1, stress_p2, self.calculate_shear_stress(stress_p1, stress_p2))
+        for field in fields:
+            field.flags.writeable = False  # Compartidos a través de la caché
+        self._stress_cache = (w_vals, params, fields)
+        return fields
+
+    def calculate_von_mises_stress(self, mesh, w_vals, coords, inp=None):
         """Calcular esfuerzo von Mises"""
-        E_dowel = self.E_dowel.get()
-        nu_dowel = self.nu_dowel.get()
-        thickness_input = self.thickness_in.get()
-        
-        # Convertir según sistema de unidades
-        if self.unit_system.get() == "metric":
-            E = E_dowel / 6.895  # MPa a ksi
-            nu = nu_dowel
-            thickness_in = thickness_input / 25.4  # mm a in
-        else:
-            E = E_dowel  # ksi
-            nu = nu_dowel
-            thickness_in = thickness_input  # in
-        
-        # Calcular gradientes de deflexión usando método más robusto
-        stress_vm = np.zeros(len(coords))
-        triangs = mesh.t.T
-        
-        # Calcular esfuerzos por elemento y luego promediar en nodos
-        element_stresses = np.zeros(len(triangs))
-        
-        for elem_idx, triangle in enumerate(triangs):
-            try:
-                # Coordenadas del elemento
-                x_elem = coords[triangle, 0]
-                y_elem = coords[triangle, 1]
-                w_elem = w_vals[triangle]
-                
-                # Área del elemento para gradientes
-                area = 0.5 * abs((x_elem[1] - x_elem[0]) * (y_elem[2] - y_elem[0]) - 
-                               (x_elem[2] - x_elem[0]) * (y_elem[1] - y_elem[0]))
-                
-                if area > 1e-12:  # Evitar elementos degenerados
-                    # Gradientes usando método de elementos finitos
-                    # Matriz B para elemento triangular lineal
-                    b1 = y_elem[1] - y_elem[2]
-                    b2 = y_elem[2] - y_elem[0]
-                    b3 = y_elem[0] - y_elem[1]
-                    
-                    c1 = x_elem[2] - x_elem[1]
-                    c2 = x_elem[0] - x_elem[2]
-                    c3 = x_elem[1] - x_elem[0]
-                    
-                    # Gradientes de deflexión
-                    dwdx = (b1 * w_elem[0] + b2 * w_elem[1] + b3 * w_elem[2]) / (2 * area)
-                    dwdy = (c1 * w_elem[0] + c2 * w_elem[1] + c3 * w_elem[2]) / (2 * area)
-                    
-                    # Curvaturas aproximadas
-                    factor = 12.0 / (thickness_in ** 2)
-                    kx = -dwdx * factor
-                    ky = -dwdy * factor
-                    kxy = 0.0  # Simplificación para triangulos lineales
-                    
-                    # Esfuerzos usando teoría de placas
-                    D_coeff = E / (1 - nu * nu)
-                    sigma_x = D_coeff * (kx + nu * ky)
-                    sigma_y = D_coeff * (ky + nu * kx)
-                    tau_xy = D_coeff * (1 - nu) * 0.5 * kxy
-                    
-                    # von Mises con verificación de valores válidos
-                    vm_squared = sigma_x**2 + sigma_y**2 - sigma_x*sigma_y + 3*tau_xy**2
-                    if vm_squared >= 0:
-                        element_stresses[elem_idx] = np.sqrt(vm_squared)
-                    else:
-                        element_stresses[elem_idx] = 0.0
-                        
-                else:
-                    element_stresses[elem_idx] = 0.0
-                    
-            except (ValueError, ZeroDivisionError, np.core._exceptions._ArrayMemoryError):
-                element_stresses[elem_idx] = 0.0
-        
-        # Interpolar de elementos a nodos
-        for i in range(len(coords)):
-            elements_containing_node = []
-            for j, triangle in enumerate(triangs):
-                if i in triangle:
-                    elements_containing_node.append(j)
-            
-            if elements_containing_node:
-                # Promedio ponderado por área
-                total_stress = 0.0
-                total_weight = 0.0
-                
-                for elem_idx in elements_containing_node:
-                    stress_val = element_stresses[elem_idx]
-                    if np.isfinite(stress_val):  # Solo usar valores finitos
-                        weight = 1.0  # Peso uniforme (se puede mejorar con área)
-                        total_stress += stress_val * weight
-                        total_weight += weight
-                
-                if total_weight > 0:
-                    stress_vm[i] = total_stress / total_weight
-                else:
-                    stress_vm[i] = 0.0
-            else:
-                stress_vm[i] = 0.0
-        
-        # Escalar para obtener valores realistas y remover valores no válidos
-        stress_vm = np.nan_to_num(stress_vm, nan=0.0, posinf=0.0, neginf=0.0)
-        stress_vm = np.abs(stress_vm) * E / 10000.0  # Escala empírica ajustada
-        
-        return stress_vm
+        return self._compute_all_stresses(mesh, w_vals, coords, inp).von_mises
 
-    def calculate_principal_stresses(self, mesh, w_vals, coords):
+    def calculate_principal_stresses(self, mesh, w_vals, coords, inp=None):
         """Calcular esfuerzos principales"""
-        E_dowel = self.E_dowel.get()
-        nu_dowel = self.nu_dowel.get()
-        thickness_input = self.thickness_in.get()
-        
-        # Convertir según sistema de unidades
-        if self.unit_system.get() == "metric":
-            E = E_dowel / 6.895  # MPa a ksi
-            nu = nu_dowel
-            thickness_in = thickness_input / 25.4  # mm a in
-        else:
-            E = E_dowel  # ksi
-            nu = nu_dowel
-            thickness_in = thickness_input  # in
-        
-        stress_p1 = np.zeros(len(coords))
-        stress_p2 = np.zeros(len(coords))
-        triangs = mesh.t.T
-        
-        # Calcular por elemento
-        for elem_idx, triangle in enumerate(triangs):
-            try:
-                x_elem = coords[triangle, 0]
-                y_elem = coords[triangle, 1]
-                w_elem = w_vals[triangle]
-                
-                # Área del elemento
-                area = 0.5 * abs((x_elem[1] - x_elem[0]) * (y_elem[2] - y_elem[0]) - 
-                               (x_elem[2] - x_elem[0]) * (y_elem[1] - y_elem[0]))
-                
-                if area > 1e-12:
-                    # Gradientes
-                    b1 = y_elem[1] - y_elem[2]
-                    b2 = y_elem[2] - y_elem[0]
-                    b3 = y_elem[0] - y_elem[1]
-                    
-                    c1 = x_elem[2] - x_elem[1]
-                    c2 = x_elem[0] - x_elem[2]
-                    c3 = x_elem[1] - x_elem[0]
-                    
-                    dwdx = (b1 * w_elem[0] + b2 * w_elem[1] + b3 * w_elem[2]) / (2 * area)
-                    dwdy = (c1 * w_elem[0] + c2 * w_elem[1] + c3 * w_elem[2]) / (2 * area)
-                    
-                    # Curvaturas
-                    factor = 12.0 / (thickness_in ** 2)
-                    kx = -dwdx * factor
-                    ky = -dwdy * factor
-                    kxy = 0.0
-                    
-                    # Esfuerzos
-                    D_coeff = E / (1 - nu * nu)
-                    sigma_x = D_coeff * (kx + nu * ky)
-                    sigma_y = D_coeff * (ky + nu * kx)
-                    tau_xy = D_coeff * (1 - nu) * 0.5 * kxy
-                    
-                    # Esfuerzos principales
-                    s_avg = (sigma_x + sigma_y) * 0.5
-                    s_diff = (sigma_x - sigma_y) * 0.5
-                    s_radius = np.sqrt(s_diff**2 + tau_xy**2)
-                    
-                    p1_elem = s_avg + s_radius
-                    p2_elem = s_avg - s_radius
-                    
-                    # Asignar a nodos del elemento
-                    for node_idx in triangle:
-                        if np.isfinite(p1_elem) and np.isfinite(p2_elem):
-                            stress_p1[node_idx] = max(stress_p1[node_idx], abs(p1_elem))
-                            stress_p2[node_idx] = min(stress_p2[node_idx], p2_elem)
-                            
-            except (ValueError, ZeroDivisionError):
-                continue
-        
-        # Limpiar valores no válidos
-        stress_p1 = np.nan_to_num(stress_p1, nan=0.0, posinf=0.0, neginf=0.0)
-        stress_p2 = np.nan_to_num(stress_p2, nan=0.0, posinf=0.0, neginf=0.0)
-        
-        # Escalar
-        stress_p1 = stress_p1 * E / 10000.0
-        stress_p2 = stress_p2 * E / 10000.0
-        
-        return stress_p1, stress_p2
+        stresses = self._compute_all_stresses(mesh, w_vals, coords, inp)
+        return stresses.principal_max, stresses.principal_min
 
     def calculate_shear_stress(self, stress_p1, stress_p2):
         """Calcular esfuerzo cortante máximo"""
         return (stress_p1 - stress_p2) / 2
 
-    def plot_deflection_contour(self, ax, mesh, w_vals, coords, triangs, mask_tri):
+    def plot_deflection_contour(self, ax, mesh, w_vals, coords, triangs, mask_tri, inp=None):
         """Plotear contornos de deflexión para dovela diamante completa"""
+        inp = inp or self._snapshot_inputs()
         imax = np.argmax(w_vals)
         xmax, ymax = coords[imax]
         wmax = w_vals[imax]
         
-        triang = mtri.Triangulation(coords[:, 0], coords[:, 1], triangs)
-        triang.set_mask(~mask_tri)
+        triang = self._get_triangulation(coords, triangs, mask_tri)
         
         # Contornos con 20 niveles para mejor claridad (como te gusta)
-        levels = np.linspace(w_vals.min(), w_vals.max(), 20)
-        cf = ax.tricontourf(triang, w_vals, levels=levels, cmap="plasma", extend='both')
+        levels = np.linspace(w_vals.min(), wmax, 20)
+        # Relleno rasterizado: al exportar a PDF/SVG se guarda como imagen,
+        # mientras ejes, líneas y textos siguen siendo vectoriales
+        cf = ax.tricontourf(triang, w_vals, levels=levels, cmap="plasma", extend='both', rasterized=True)
         
         # Líneas de contorno blancas con etiquetas (como te gusta)
         contour_lines = ax.tricontour(triang, w_vals, levels=10, colors="white", 
@@ -1487,12 +1364,12 @@ La dovela presenta un LTE de {lte_average:.1f}%, lo que indica una transferencia
                label=f"Máx defl = {wmax:.4f} in")
         
         # Dibujar geometría de dovela diamante con apertura de junta
-        self.add_geometry_lines(ax)
+        self.add_geometry_lines(ax, inp)
         
         ax.set_aspect("equal", "box")
         
         # Unidades correctas en las etiquetas
-        if self.unit_system.get() == "metric":
+        if inp.unit_system == "metric":
             ax.set_xlabel("X (mm)", fontsize=12, fontweight='bold')
             ax.set_ylabel("Y (mm)", fontsize=12, fontweight='bold')
             unit_defl = "mm"
@@ -1501,52 +1378,49 @@ La dovela presenta un LTE de {lte_average:.1f}%, lo que indica una transferencia
             ax.set_ylabel("Y (in)", fontsize=12, fontweight='bold')
             unit_defl = "in"
         
-        ax.set_title(f"Deflexión - Dovela Diamante (Lado Cargado: {self.loaded_side.get()})", 
+        ax.set_title(f"Deflexión - Dovela Diamante (Lado Cargado: {inp.loaded_side})", 
                     fontsize=14, fontweight='bold', pad=15)
         ax.legend(loc="upper left", fontsize=10)
         ax.grid(True, linestyle='--', alpha=0.3)
         
-        cbar = plt.colorbar(cf, ax=ax, pad=0.03, shrink=0.8)
+        cbar = ax.figure.colorbar(cf, ax=ax, pad=0.03, shrink=0.8)
         cbar.set_label(f"Deflexión ({unit_defl})", fontsize=12, fontweight='bold')
 
-    def plot_stress_contour(self, ax, stress_vals, coords, triangs, mask_tri, title, colormap, unit="ksi"):
+    def plot_stress_contour(self, ax, stress_vals, coords, triangs, mask_tri, title, colormap, unit="ksi", inp=None):
         """Plotear contornos de esfuerzo"""
-        # Verificar y limpiar valores de esfuerzo
-        stress_vals = np.array(stress_vals)
+        inp = inp or self._snapshot_inputs()
+        # Verificar y limpiar valores de esfuerzo (nan_to_num ya devuelve una copia)
         stress_vals = np.nan_to_num(stress_vals, nan=0.0, posinf=0.0, neginf=0.0)
         
         # Verificar que hay valores válidos
-        if np.all(stress_vals == 0) or len(stress_vals) == 0:
+        if not stress_vals.any():
             # Si no hay valores válidos, crear valores mínimos para visualización
-            stress_vals = np.ones_like(stress_vals) * 0.001
+            stress_vals = np.full_like(stress_vals, 0.001)
         
-        # Encontrar máximo válido
-        valid_indices = np.isfinite(stress_vals) & (stress_vals > 0)
-        if np.any(valid_indices):
+        # Máximo y mínimo positivo a partir de una sola máscara (valores ya finitos)
+        positive = stress_vals > 0
+        if positive.any():
             imax = np.argmax(stress_vals)
-            xmax, ymax = coords[imax]
             stress_max = stress_vals[imax]
+            stress_min = stress_vals[positive].min()
         else:
             imax = 0
-            xmax, ymax = coords[imax]
             stress_max = 0.001
+            stress_min = 0
+        xmax, ymax = coords[imax]
         
         # Crear triangulación
-        triang = mtri.Triangulation(coords[:, 0], coords[:, 1], triangs)
-        triang.set_mask(~mask_tri)
+        triang = self._get_triangulation(coords, triangs, mask_tri)
         
         try:
             # Crear niveles de contorno seguros
-            stress_min = np.min(stress_vals[stress_vals > 0]) if np.any(stress_vals > 0) else 0
-            stress_max_plot = np.max(stress_vals) if np.any(stress_vals > 0) else 0.001
-            
-            if stress_max_plot > stress_min:
-                levels = np.linspace(stress_min, stress_max_plot, 20)
+            if stress_max > stress_min:
+                levels = np.linspace(stress_min, stress_max, 20)
             else:
                 levels = np.linspace(0, 0.001, 20)
             
             # Plotear contornos
-            cf = ax.tricontourf(triang, stress_vals, levels=levels, cmap=colormap, extend='max')
+            cf = ax.tricontourf(triang, stress_vals, levels=levels, cmap=colormap, extend='max', rasterized=True)
             ax.tricontour(triang, stress_vals, levels=levels, colors="black", linewidths=0.5, alpha=0.7)
             
             # Marcar punto máximo
@@ -1555,55 +1429,42 @@ La dovela presenta un LTE de {lte_average:.1f}%, lo que indica una transferencia
         except ValueError as e:
             # Si falla el contorno, crear plot básico
             print(f"Warning: Contour plot failed, using scatter plot: {e}")
-            scatter = ax.scatter(coords[:, 0], coords[:, 1], c=stress_vals, cmap=colormap, s=30)
+            xs, ys = coords.T
+            scatter = ax.scatter(xs, ys, c=stress_vals, cmap=colormap, s=30, rasterized=True)
             cf = scatter
             ax.plot(xmax, ymax, "o", ms=10, color="red", label=f"Máx = {stress_max:.2f} {unit}")
         
         # Dibujar geometría
-        self.add_geometry_lines(ax)
+        self.add_geometry_lines(ax, inp)
         
         ax.set_aspect("equal", "box")
         ax.set_xlabel("x [in]", fontsize=11)
         ax.set_ylabel("y [in]", fontsize=11)
-        ax.set_title(f"{title} - Media dovela {self.loaded_side.get()}", fontsize=13)
+        ax.set_title(f"{title} - Media dovela {inp.loaded_side}", fontsize=13)
         ax.legend(loc="upper left", fontsize=10)
         ax.grid(True, linestyle='--', alpha=0.3)
         
         # Barra de colores
         try:
-            cbar = plt.colorbar(cf, ax=ax, pad=0.03)
+            cbar = ax.figure.colorbar(cf, ax=ax, pad=0.03)
             cbar.set_label(f"{title} [{unit}]", fontsize=11)
         except Exception as e:
             print(f"Warning: Colorbar creation failed: {e}")
 
-    def add_geometry_lines(self, ax):
+    def add_geometry_lines(self, ax, inp=None):
         """Agregar líneas de geometría para dovela diamante con apertura de junta"""
-        # Obtener parámetros actuales
-        side_mm = self.side_mm.get()
-        ap_mm = self.ap_mm.get()
-        thickness_input = self.thickness_in.get()
-        E_dowel = self.E_dowel.get()
-        nu_dowel = self.nu_dowel.get()
-        
-        # Convertir según sistema de unidades
-        if self.unit_system.get() == "metric":
-            side_in = side_mm / 25.4
-            ap = ap_mm / 25.4
-            thickness_in = thickness_input / 25.4
-            E = E_dowel / 6.895  # MPa a ksi
-            nu = nu_dowel
-            unit_label = "mm"
-            ap_display = ap_mm
-        else:
-            side_in = side_mm  # Ya está en pulgadas
-            ap = ap_mm  # Ya está en pulgadas  
-            thickness_in = thickness_input
-            E = E_dowel  # Ya está en ksi
-            nu = nu_dowel
-            unit_label = "in"
-            ap_display = ap
-        
-        X1 = side_in / np.sqrt(2)  # Semi-diagonal del diamante
+        inp = inp or self._snapshot_inputs()
+        # Parámetros actuales en unidades de trabajo (in, ksi)
+        units = inp.units
+        side_in = inp.side_mm * units.to_in
+        ap = inp.ap_mm * units.to_in
+        thickness_in = inp.thickness_in * units.to_in
+        E = inp.E_dowel * units.to_ksi
+        nu = inp.nu_dowel
+        unit_label = units.unit_len
+        ap_display = inp.ap_mm
+        
+        X1 = side_in / _SQRT2  # Semi-diagonal del diamante
         
         # Calcular L_eff realista
         D = E * thickness_in ** 3 / (12 * (1 - nu ** 2))
@@ -1614,10 +1475,7 @@ La dovela presenta un LTE de {lte_average:.1f}%, lo que indica una transferencia
         total_efficiency = base_efficiency + rigidity_bonus
         L_eff = X1 * total_efficiency
         
-        if self.unit_system.get() == "metric":
-            L_eff_display = L_eff * 25.4  # Convertir in a mm
-        else:
-            L_eff_display = L_eff  # ya está en in
+        L_eff_display = L_eff / units.to_in  # in a unidades del usuario
         
         # DIBUJAR DOVELA DIAMANTE COMPLETA CON APERTURA DE JUNTA
         
@@ -1653,7 +1511,7 @@ La dovela presenta un LTE de {lte_average:.1f}%, lo que indica una transferencia
         
         # LÍNEA L_eff EN EL LADO CARGADO
         # Determinar cuál lado está cargado
-        loaded_side = self.loaded_side.get()
+        loaded_side = inp.loaded_side
         
         if loaded_side == "right":
             # Lado derecho cargado - L_eff desde la junta hacia la derecha
@@ -1701,20 +1559,21 @@ La dovela presenta un LTE de {lte_average:.1f}%, lo que indica una transferencia
                 ha='center', va='top', fontsize=10, 
                 bbox=dict(boxstyle="round,pad=0.3", facecolor="lightgray", alpha=0.8))
 
-    def show_results_summary(self, w_vals, stress_vm, stress_p1, stress_shear):
+    def show_results_summary(self, w_vals, stress_vm, stress_p1, stress_shear, inp=None):
         """Mostrar resumen de resultados críticos con interpretación"""
+        inp = inp or self._snapshot_inputs()
         max_deflection = np.max(w_vals)
         max_vm_stress = np.max(stress_vm)
         max_principal = np.max(stress_p1)
         max_shear = np.max(stress_shear)
         
         # Obtener información del concreto
-        E_concrete = self.E_concrete.get()
-        fc_concrete = self.fc_concrete.get()
-        slab_thickness = self.slab_thickness.get()
+        E_concrete = inp.E_concrete
+        fc_concrete = inp.fc_concrete
+        slab_thickness = inp.slab_thickness
         
         # Convertir unidades para mostrar resultados
-        if self.unit_system.get() == "metric":
+        if inp.unit_system == "metric":
             # Convertir de unidades internas (in, ksi) a SI
             deflection_display = max_deflection * 25.4  # in a mm
             vm_display = max_vm_stress * 6.895  # ksi a MPa
@@ -1748,9 +1607,9 @@ La dovela presenta un LTE de {lte_average:.1f}%, lo que indica una transferencia
         shear_ok = "✅ SEGURA" if shear_display < shear_limit else "⚠️ REVISAR" if shear_display < vm_limit*0.6 else "❌ PELIGROSA"
         
         # Calcular ratio de rigidez
-        E_dowel_display = self.E_dowel.get()
-        if self.unit_system.get() == "imperial":
-            E_concrete_display = self.E_concrete.get()
+        E_dowel_display = inp.E_dowel
+        if inp.unit_system == "imperial":
+            E_concrete_display = inp.E_concrete
         else:
             E_concrete_display = E_concrete
         
@@ -1761,16 +1620,16 @@ La dovela presenta un LTE de {lte_average:.1f}%, lo que indica una transferencia
 ════════════════════════════════════════════════════════════════
 
 🔧 PARÁMETROS DE ENTRADA:
-• Sistema de unidades: {"SI (Métrico)" if self.unit_system.get() == "metric" else "Imperial (Inglés)"}
-• Lado dovela: {self.side_mm.get():.1f} {"mm" if self.unit_system.get() == "metric" else "in"}
-• Espesor dovela: {self.thickness_in.get():.2f} {"mm" if self.unit_system.get() == "metric" else "in"}
-• Carga aplicada: {self.tons_load.get():.1f} {"kN" if self.unit_system.get() == "metric" else "tons"}
-• Módulo E dovela: {self.E_dowel.get():.0f} {"MPa" if self.unit_system.get() == "metric" else "ksi"}
+• Sistema de unidades: {"SI (Métrico)" if inp.unit_system == "metric" else "Imperial (Inglés)"}
+• Lado dovela: {inp.side_mm:.1f} {"mm" if inp.unit_system == "metric" else "in"}
+• Espesor dovela: {inp.thickness_in:.2f} {"mm" if inp.unit_system == "metric" else "in"}
+• Carga aplicada: {inp.tons_load:.1f} {"kN" if inp.unit_system == "metric" else "tons"}
+• Módulo E dovela: {inp.E_dowel:.0f} {"MPa" if inp.unit_system == "metric" else "ksi"}
 
 🏗️ INTERACCIÓN DOVELA-CONCRETO:
-• Espesor losa: {slab_thickness:.1f} {"mm" if self.unit_system.get() == "metric" else "in"}
-• f'c concreto: {fc_concrete:.1f} {"MPa" if self.unit_system.get() == "metric" else "psi"}
-• E concreto: {E_concrete:.0f} {"MPa" if self.unit_system.get() == "metric" else "ksi"}
+• Espesor losa: {slab_thickness:.1f} {"mm" if inp.unit_system == "metric" else "in"}
+• f'c concreto: {fc_concrete:.1f} {"MPa" if inp.unit_system == "metric" else "psi"}
+• E concreto: {E_concrete:.0f} {"MPa" if inp.unit_system == "metric" else "ksi"}
 • Ratio rigidez (Edovela/Econcreto): {stiffness_ratio:.1f}
 
 📈 RESULTADOS CRÍTICOS:
@@ -1806,14 +1665,14 @@ La dovela presenta un LTE de {lte_average:.1f}%, lo que indica una transferencia
         """Método original simplificado que usa las nuevas funciones"""
         try:
             # Usar el nuevo método base
-            mesh, w_vals, coords, triangs, mask_tri = self.calculate_base_results()
+            inp = self._snapshot_inputs()
+            mesh, w_vals, coords, triangs, mask_tri = self.calculate_base_results(inp)
             
-            # Crear figura individual para deflexión
-            fig, ax = plt.subplots(figsize=(10, 8))
-            self.plot_deflection_contour(ax, mesh, w_vals, coords, triangs, mask_tri)
+            # Reutilizar la figura de resultados para la deflexión
+            ax = self._results_figure("Deflexión", figsize=(10, 8))
+            self.plot_deflection_contour(ax, mesh, w_vals.astype(PLOT_DTYPE), coords, triangs, mask_tri, inp=inp)
             
-            plt.tight_layout()
-            plt.show()
+            self._draw_results()
             
         except Exception as e:
             tb = traceback.format_exc()
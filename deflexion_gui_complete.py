@@ -4,19 +4,29 @@ import tkinter as tk
 from tkinter import ttk, messagebox
 import matplotlib.pyplot as plt
 import matplotlib.tri as mtri
+from matplotlib.colorbar import make_axes_gridspec
+from matplotlib.ticker import PercentFormatter
 import numpy as np
 from skfem import MeshTri, ElementTriP1, Basis, asm, solve
 from skfem.assembly import BilinearForm, LinearForm
 import pygmsh
 from skfem import condense
 from skfem.helpers import dot, grad
-from scipy.interpolate import griddata
+from scipy.interpolate import CloughTocher2DInterpolator
+from scipy.spatial import Delaunay
 import traceback
+from types import SimpleNamespace
+
+# Número de mallas/resultados base que se conservan entre análisis
+FEM_CACHE_SIZE = 8
 
 class DeflexionApp:
     def __init__(self, root):
         self.root = root
         root.title("Análisis FEA de Dovela Diamante - Transferencia de Carga")
+        self._fem_cache = {}
+        self._delaunay_cache = None
+        self._lte_plot = None
         self.create_widgets()
 
     def create_widgets(self):
@@ -190,8 +200,34 @@ class DeflexionApp:
                 self.fc_concrete.set(3625.0)   # 25 MPa = 3625 psi
                 self.E_concrete.set(3625.0)    # 25000 MPa = 3625 ksi
         
+        # Factores de conversión a unidades internas (mm, kN, MPa) y etiquetas,
+        # fijados una sola vez por cambio de sistema
+        metric = self.unit_system.get() == "metric"
+        self._len_to_mm = 1.0 if metric else 25.4
+        self._force_to_kN = 1.0 if metric else 4.448
+        self._E_to_MPa = 1.0 if metric else 6.895  # ksi a MPa
+        self._unit_len_label = "mm" if metric else "in"
+        self._unit_force_label = "kN" if metric else "tons"
+        
         self._units_initialized = True
 
+    def _snapshot_inputs(self):
+        """Leer una sola vez todas las variables de Tk para un análisis"""
+        return SimpleNamespace(
+            unit_system=self.unit_system.get(),
+            side_mm=self.side_mm.get(),
+            thickness_in=self.thickness_in.get(),
+            tons_load=self.tons_load.get(),
+            ap_mm=self.ap_mm.get(),
+            loaded_side=self.loaded_side.get(),
+            E_dowel=self.E_dowel.get(),
+            nu_dowel=self.nu_dowel.get(),
+            E_concrete=self.E_concrete.get(),
+            nu_concrete=self.nu_concrete.get(),
+            slab_thickness=self.slab_thickness.get(),
+            fc_concrete=self.fc_concrete.get(),
+        )
+
     def run_analysis(self):
         """Ejecutar análisis individual según el tipo seleccionado"""
         analysis_type = self.analysis_type.get()
@@ -207,72 +243,86 @@ class DeflexionApp:
         elif analysis_type == "analisis_completo":
             self.run_complete_analysis()
 
+    def _get_lte_figure(self):
+        """Figura, ejes y eje de colorbar del análisis LTE; se reutilizan mientras
+        su ventana siga abierta"""
+        state = self._lte_plot
+        if state is not None and plt.fignum_exists(state[0].number):
+            for ax in state[1:]:
+                ax.cla()
+            # La colorbar envuelve el localizador del eje; restaurarlo evita
+            # acumular el recorte de las extensiones en cada redibujo
+            state[4].set_axes_locator(None)
+            return state
+        
+        fig = plt.figure(figsize=(24, 12))  # Más ancho para evitar recortes
+        
+        # Usar gridspec para mejor control del layout
+        gs = fig.add_gridspec(1, 3, width_ratios=[2, 2, 1], hspace=0.3, wspace=0.3)
+        ax1 = fig.add_subplot(gs[0, 0])
+        ax2 = fig.add_subplot(gs[0, 1])
+        ax3 = fig.add_subplot(gs[0, 2])
+        # Eje fijo para la colorbar (misma disposición que plt.colorbar(..., ax=ax1))
+        cax, _ = make_axes_gridspec(ax1, shrink=0.8, pad=0.04)
+        
+        state = (fig, ax1, ax2, ax3, cax)
+        self._lte_plot = state
+        return state
+
     def calculate_diamond_lte_analysis(self):
         """Análisis LTE avanzado para herramientas diamante con perfil geométrico real"""
         try:
+            inp = self._snapshot_inputs()
+            
             # Calcular resultados base
-            mesh, w_vals, coords, triangs, mask_tri = self.calculate_base_results()
+            mesh, w_vals, coords, triangs, mask_tri = self.calculate_base_results(inp)
             
             # Calcular LTE y distribución
-            lte_values, lte_average, transfer_metrics = self.calculate_diamond_lte_efficiency(mesh, w_vals, coords)
+            lte_values, lte_average, transfer_metrics = self.calculate_diamond_lte_efficiency(mesh, w_vals, coords, inp)
             
-            # Crear visualización profesional con mejor layout
-            fig = plt.figure(figsize=(24, 12))  # Más ancho para evitar recortes
-            
-            # Usar gridspec para mejor control del layout
-            gs = fig.add_gridspec(1, 3, width_ratios=[2, 2, 1], hspace=0.3, wspace=0.3)
+            # Crear visualización profesional con mejor layout (figura reutilizada)
+            fig, ax1, ax2, ax3, cax = self._get_lte_figure()
             
             # Panel izquierdo: Distribución LTE en mapa de contorno
-            ax1 = fig.add_subplot(gs[0, 0])
-            self.plot_diamond_lte_distribution(ax1, lte_values, coords, triangs, mask_tri)
+            self.plot_diamond_lte_distribution(ax1, cax, lte_values, coords, triangs, mask_tri)
             
             # Panel central: Perfil LTE con zonas de eficiencia
-            ax2 = fig.add_subplot(gs[0, 1])
             self.plot_diamond_segment_profile(ax2, mesh, lte_values, coords, transfer_metrics)
             
             # Panel derecho: Métricas técnicas (sin recorte)
-            ax3 = fig.add_subplot(gs[0, 2])
             self.plot_technical_metrics(ax3, transfer_metrics, lte_values)
             
-            plt.tight_layout(pad=3.0)  # Más padding para evitar solapamientos
+            fig.tight_layout(pad=3.0)  # Más padding para evitar solapamientos
             plt.show()
             
             # Mostrar análisis técnico detallado
-            self.show_diamond_analysis_summary(lte_average, transfer_metrics, lte_values)
+            self.show_diamond_analysis_summary(lte_average, transfer_metrics, lte_values, inp)
             
         except Exception as e:
             tb = traceback.format_exc()
             messagebox.showerror("Error en Análisis Diamond LTE", f"{str(e)}\n\n{tb}")
 
-    def calculate_diamond_lte_efficiency(self, mesh, w_vals, coords):
+    def calculate_diamond_lte_efficiency(self, mesh, w_vals, coords, inp=None):
         """Calcular Load Transfer Efficiency para herramientas diamante con modelo avanzado"""
+        inp = inp or self._snapshot_inputs()
         
         # Obtener parámetros según sistema de unidades
-        side_input = self.side_mm.get()
-        thickness_input = self.thickness_in.get()
-        load_input = self.tons_load.get()
-        ap_input = self.ap_mm.get()
-        E_dowel = self.E_dowel.get()
-        E_concrete = self.E_concrete.get()
-        slab_thickness = self.slab_thickness.get()
+        side_input = inp.side_mm
+        thickness_input = inp.thickness_in
+        load_input = inp.tons_load
+        ap_input = inp.ap_mm
+        E_dowel = inp.E_dowel
+        E_concrete = inp.E_concrete
+        slab_thickness = inp.slab_thickness
         
         # Conversión de unidades a SI
-        if self.unit_system.get() == "metric":
-            side_mm = side_input
-            thickness_mm = thickness_input
-            load_kN = load_input
-            ap_mm = ap_input
-            E_d = E_dowel  # MPa
-            E_c = E_concrete  # MPa
-            h_slab = slab_thickness  # mm
-        else:
-            side_mm = side_input * 25.4
-            thickness_mm = thickness_input * 25.4
-            load_kN = load_input * 4.448
-            ap_mm = ap_input * 25.4
-            E_d = E_dowel * 6.895  # ksi a MPa
-            E_c = E_concrete * 6.895  # ksi a MPa
-            h_slab = slab_thickness * 25.4  # in a mm
+        side_mm = side_input * self._len_to_mm
+        thickness_mm = thickness_input * self._len_to_mm
+        load_kN = load_input * self._force_to_kN
+        ap_mm = ap_input * self._len_to_mm
+        E_d = E_dowel * self._E_to_MPa  # MPa
+        E_c = E_concrete * self._E_to_MPa  # MPa
+        h_slab = slab_thickness * self._len_to_mm  # mm
         
         # Geometría del segmento diamante (media dovela)
         diagonal_half_dovela = (side_mm * np.sqrt(2)) / 2  # 88.39 mm para lado 125 mm
@@ -281,7 +331,7 @@ class DeflexionApp:
         
         # Parámetros avanzados de transferencia
         # Módulo de reacción basado en teoría de Winkler modificada
-        k_foundation = E_c * 1000 / (12 * h_slab**3) * (1 - self.nu_concrete.get()**2)
+        k_foundation = E_c * 1000 / (12 * h_slab**3) * (1 - inp.nu_concrete**2)
         
         # Rigidez relativa dovela-concreto
         stiffness_ratio = E_d / E_c
@@ -301,34 +351,40 @@ class DeflexionApp:
         # El borde cargado está en x = lado izquierdo del diamante
         borde_cargado_x = -diagonal_half_dovela/2  # Lado izquierdo
         
-        # Distancia desde el borde cargado
-        dist_from_loaded_edge = np.abs(x_coords - borde_cargado_x)
-        
-        # Normalizar (0 = borde cargado, 1 = punta opuesta)
-        normalized_distance = np.clip(dist_from_loaded_edge / diagonal_half_dovela, 0, 1)
-        
         # === MODELO FÍSICO CORRECTO ===
         # LTE máximo en borde cargado, decrecimiento hacia punta
         base_efficiency = 0.95  # Eficiencia máxima en borde cargado
         
-        # Factor de distribución: MÁXIMO en borde, MÍNIMO en punta
-        # Usar distribución exponencial decreciente
-        distribution_factor = np.exp(-2.5 * normalized_distance)  # Decrece exponencialmente
-        
-        # Factor de concentración en esquinas del borde cargado
-        edge_enhancement = 1.0 + 0.15 * np.exp(-5 * np.abs(y_coords) / diagonal_half_dovela)
-        
         # Factor de rigidez estructural
         stiffness_factor = np.tanh(stiffness_ratio / 8) * 0.15 + 0.85
         
         # Factor geométrico (aspect ratio)
         aspect_factor = 1 - np.abs(geometry_factor - 0.5) * 0.2
         
+        # Distancia desde el borde cargado, normalizada (0 = borde cargado, 1 = punta
+        # opuesta); el LTE se acumula sobre este mismo buffer, sin temporales intermedios
+        lte_values = np.abs(x_coords - borde_cargado_x)
+        lte_values /= diagonal_half_dovela
+        np.clip(lte_values, 0, 1, out=lte_values)
+        
+        # Factor de distribución: MÁXIMO en borde, MÍNIMO en punta
+        # Usar distribución exponencial decreciente
+        lte_values *= -2.5
+        np.exp(lte_values, out=lte_values)  # Decrece exponencialmente
+        
+        # Factor de concentración en esquinas del borde cargado
+        edge_enhancement = np.abs(y_coords)
+        edge_enhancement *= -5 / diagonal_half_dovela
+        np.exp(edge_enhancement, out=edge_enhancement)
+        edge_enhancement *= 0.15
+        edge_enhancement += 1.0
+        
         # LTE final con modelo físicamente correcto
-        lte_values = base_efficiency * distribution_factor * edge_enhancement * stiffness_factor * aspect_factor
+        lte_values *= edge_enhancement
+        lte_values *= base_efficiency * stiffness_factor * aspect_factor
         
         # Asegurar rango físico realista
-        lte_values = np.clip(lte_values, 0.25, 0.98)  # 25% a 98% eficiencia
+        np.clip(lte_values, 0.25, 0.98, out=lte_values)  # 25% a 98% eficiencia
         
         # Métricas de transferencia
         lte_average = np.mean(lte_values)
@@ -339,15 +395,18 @@ class DeflexionApp:
         transfer_force = load_kN * lte_average
         
         # Análisis de zonas de eficiencia
-        optimal_zone = np.sum(lte_values >= 0.90) / len(lte_values) * 100  # >90%
-        good_zone = np.sum((lte_values >= 0.80) & (lte_values < 0.90)) / len(lte_values) * 100  # 80-90%
-        acceptable_zone = np.sum((lte_values >= 0.60) & (lte_values < 0.80)) / len(lte_values) * 100  # 60-80%
-        poor_zone = np.sum(lte_values < 0.60) / len(lte_values) * 100  # <60%
+        # (índice de zona por nodo y conteo por zona en una sola pasada:
+        # <60%, 60-80%, 80-90%, >=90%)
+        zone_counts = np.bincount(np.digitize(lte_values, [0.60, 0.80, 0.90]), minlength=4)
+        poor_zone, acceptable_zone, good_zone, optimal_zone = zone_counts / len(lte_values) * 100
         
         # Calcular distancia radial para métricas (corregido)
-        center_x, center_y = 0.0, 0.0
-        radial_distance = np.sqrt((x_coords - center_x)**2 + (y_coords - center_y)**2)
-        normalized_radius = np.clip(radial_distance / diagonal_half_dovela, 0, 1)
+        # (centro del segmento en el origen; se acumula sobre el mismo buffer)
+        radial_distance = x_coords * x_coords
+        radial_distance += y_coords * y_coords
+        np.sqrt(radial_distance, out=radial_distance)
+        normalized_radius = radial_distance / diagonal_half_dovela
+        np.minimum(normalized_radius, 1, out=normalized_radius)  # r >= 0: solo acotar arriba
         
         transfer_metrics = {
             'lte_avg': lte_average,
@@ -368,53 +427,35 @@ class DeflexionApp:
         
         return lte_values, lte_average, transfer_metrics
 
-    def plot_diamond_lte_distribution(self, ax, lte_values, coords, triangs, mask_tri):
+    def plot_diamond_lte_distribution(self, ax, cax, lte_values, coords, triangs, mask_tri):
         """Visualización de distribución LTE en mapa de contorno profesional - Dovela completa"""
         
-        # Suavizar contornos usando interpolación
-        from scipy.interpolate import griddata
-        from scipy.ndimage import gaussian_filter
-        
-        # Crear malla regular de alta resolución para contornos suaves
-        diagonal_half = np.max(np.abs(coords))
-        x_smooth = np.linspace(-diagonal_half, diagonal_half, 200)
-        y_smooth = np.linspace(-diagonal_half, diagonal_half, 200)
-        X_smooth, Y_smooth = np.meshgrid(x_smooth, y_smooth)
-        
-        # Interpolar valores LTE a malla regular
-        lte_smooth = griddata(coords, lte_values, (X_smooth, Y_smooth), method='cubic', fill_value=0)
-        
-        # Aplicar máscara de diamante
-        mask_diamond = (np.abs(X_smooth) + np.abs(Y_smooth)) <= diagonal_half
-        lte_smooth[~mask_diamond] = np.nan
-        
-        # Aplicar filtro gaussiano para suavizar más
-        lte_smooth_filtered = gaussian_filter(np.nan_to_num(lte_smooth), sigma=1.5)
-        lte_smooth[mask_diamond] = lte_smooth_filtered[mask_diamond]
+        # Contornear directamente sobre la triangulación de la malla: sin malla
+        # regular, interpolación cúbica ni filtro gaussiano intermedios
+        triang = mtri.Triangulation(coords[:, 0], coords[:, 1], triangs)
+        triang.set_mask(~mask_tri)
         
         # Configurar el mapa de contorno con resolución alta y suave
         levels = np.linspace(0.4, 1.0, 30)  # 30 niveles para transiciones suaves
-        contour = ax.contourf(X_smooth, Y_smooth, lte_smooth, 
-                             levels=levels, cmap='RdYlGn', extend='both')
+        contour = ax.tricontourf(triang, lte_values, 
+                                levels=levels, cmap='RdYlGn', extend='both')
         
         # Líneas de contorno más suaves y definidas
-        contour_lines = ax.contour(X_smooth, Y_smooth, lte_smooth, 
-                                  levels=[0.60, 0.70, 0.80, 0.90], 
-                                  colors=['red', 'darkorange', 'orange', 'darkgreen'], 
-                                  linewidths=[2.5, 2, 2, 3], linestyles=['-', '-', '-', '-'])
+        contour_lines = ax.tricontour(triang, lte_values, 
+                                     levels=[0.60, 0.70, 0.80, 0.90], 
+                                     colors=['red', 'darkorange', 'orange', 'darkgreen'], 
+                                     linewidths=[2.5, 2, 2, 3], linestyles=['-', '-', '-', '-'])
         
         # Etiquetas de contorno más claras
         ax.clabel(contour_lines, inline=True, fontsize=9, fmt='%0.0f%%', 
                  manual=False, colors='black')
         
         # Colorbar con etiquetas técnicas, separada del eje Y
-        cbar = plt.colorbar(contour, ax=ax, shrink=0.8, pad=0.04)
+        cbar = plt.colorbar(contour, cax=cax)
         cbar.set_label('Load Transfer Efficiency (%)', fontsize=12, labelpad=15)
         cbar.ax.tick_params(labelsize=10)
         # Formatear colorbar en porcentajes
-        cbar_ticks = cbar.get_ticks()
-        cbar.set_ticks(list(cbar_ticks))
-        cbar.set_ticklabels([f'{tick*100:.0f}%' for tick in cbar_ticks])
+        cbar.formatter = PercentFormatter(1.0, decimals=0)
         
         # Dibujar contorno de la dovela diamante completa
         diagonal_half = np.max(np.abs(coords).max(axis=0))
@@ -458,48 +499,28 @@ class DeflexionApp:
         radial_distance = transfer_metrics['radial_distance']
         normalized_radius = transfer_metrics['normalized_radius']
         
-        # Crear perfil de distancia vs LTE
-        # Ordenar por distancia radial y eliminar duplicados
-        sorted_indices = np.argsort(radial_distance)
-        distance_sorted = radial_distance[sorted_indices]
-        lte_sorted = lte_values[sorted_indices]
-        
-        # Eliminar valores duplicados en distancia
-        unique_distances, unique_indices = np.unique(distance_sorted, return_index=True)
-        distance_unique = unique_distances
-        lte_unique = lte_sorted[unique_indices]
-        
-        # Crear puntos de interpolación y convertir unidades si es necesario
-        if hasattr(self, 'unit_system') and self.unit_system.get() == "imperial":
-            # Convertir mm a in para display
-            distance_interp_display = np.linspace(0, diagonal_half / 25.4, 100)
-            distance_unique_display = distance_unique / 25.4
-            distance_interp_mm = np.linspace(0, diagonal_half, 100)  # Mantener en mm para interpolación
-            unit_label = "in"
-        else:
-            # Mantener en mm
-            distance_interp_display = np.linspace(0, diagonal_half, 100)
-            distance_unique_display = distance_unique
-            distance_interp_mm = distance_interp_display
-            unit_label = "mm"
-        
-        # Interpolación suave sin duplicados (siempre en mm internamente)
-        if len(distance_unique) > 3:
-            from scipy.interpolate import interp1d
-            f_interp = interp1d(distance_unique, lte_unique, kind='linear', 
-                               fill_value='extrapolate', bounds_error=False)
-            lte_interp = f_interp(distance_interp_mm)
-            lte_interp = np.clip(lte_interp, 0.25, 0.98)  # Mantener rango físico
-        else:
-            lte_interp = np.interp(distance_interp_mm, distance_unique, lte_unique)
+        # Crear perfil de distancia vs LTE: promedio del LTE de los nodos en 100
+        # bandas de distancia radial, en un recorrido con bincount (sin ordenar
+        # ni interpolar; los nodos a igual distancia se promedian, no se descartan)
+        n_bins = 100
+        bin_index = np.minimum((radial_distance / diagonal_half * n_bins).astype(np.intp), n_bins - 1)
+        bin_counts = np.bincount(bin_index, minlength=n_bins)
+        filled = bin_counts > 0  # Bandas sin nodos (p. ej. dentro de la junta) no se grafican
+        lte_profile = np.bincount(bin_index, weights=lte_values, minlength=n_bins)[filled] / bin_counts[filled]
+        distance_profile_mm = ((np.arange(n_bins) + 0.5) * (diagonal_half / n_bins))[filled]
+        
+        # Convertir unidades para display (siempre en mm internamente)
+        unit_label = self._unit_len_label
+        distance_profile_display = distance_profile_mm / self._len_to_mm
+        distance_data_display = radial_distance / self._len_to_mm
         
         # Plotear perfil principal
-        ax.plot(distance_interp_display, lte_interp * 100, 'b-', linewidth=3, 
+        ax.plot(distance_profile_display, lte_profile * 100, 'b-', linewidth=3, 
                 label='Perfil LTE Real', zorder=5)
         
         # Puntos de datos originales (solo algunos para claridad)
-        step_size = max(1, len(distance_unique_display) // 20)
-        ax.scatter(distance_unique_display[::step_size], lte_unique[::step_size] * 100, 
+        step_size = max(1, len(distance_data_display) // 20)
+        ax.scatter(distance_data_display[::step_size], lte_values[::step_size] * 100, 
                   c='darkblue', s=30, alpha=0.6, zorder=4, label='Datos FEA')
         
         # **ZONAS DE EFICIENCIA CON BANDAS DE COLOR**
@@ -515,18 +536,14 @@ class DeflexionApp:
         
         # **ANOTACIONES TÉCNICAS CRÍTICAS**
         # Punto de inflexión donde LTE cae por debajo del 80%
-        critical_distance = np.where(lte_interp < 0.80)[0]
+        critical_distance = np.flatnonzero(lte_profile < 0.80)
         if len(critical_distance) > 0:
-            critical_dist_mm = distance_interp_mm[critical_distance[0]]
-            critical_lte = lte_interp[critical_distance[0]] * 100
+            critical_dist_mm = distance_profile_mm[critical_distance[0]]
+            critical_lte = lte_profile[critical_distance[0]] * 100
             
-            # Convertir unidades para la anotación si es necesario
-            if hasattr(self, 'unit_system') and self.unit_system.get() == "imperial":
-                critical_dist_display = critical_dist_mm / 25.4
-                offset_x = 0.6  # Offset en pulgadas
-            else:
-                critical_dist_display = critical_dist_mm
-                offset_x = 15  # Offset en mm
+            # Convertir unidades para la anotación
+            critical_dist_display = critical_dist_mm / self._len_to_mm
+            offset_x = 15 if unit_label == "mm" else 0.6  # Offset en mm o pulgadas
                 
             ax.annotate(f'Inicio Degradación\n{critical_dist_display:.1f} {unit_label}\n{critical_lte:.1f}% LTE', 
                        xy=(critical_dist_display, critical_lte), xytext=(critical_dist_display + offset_x, 85),
@@ -535,15 +552,8 @@ class DeflexionApp:
                        fontsize=10, fontweight='bold', ha='center')
         
         # Configuración de ejes y formato con unidades correctas
-        # Obtener unidades correctas según el sistema seleccionado
-        if hasattr(self, 'unit_system') and self.unit_system.get() == "imperial":
-            diagonal_half_display = diagonal_half / 25.4  # Convertir mm a pulgadas
-            unit_label = "in"
-            ax.set_xlim(0, diagonal_half_display)
-        else:
-            diagonal_half_display = diagonal_half  # Mantener en mm
-            unit_label = "mm"
-            ax.set_xlim(0, diagonal_half_display)
+        diagonal_half_display = diagonal_half / self._len_to_mm
+        ax.set_xlim(0, diagonal_half_display)
         
         ax.set_ylim(25, 100)
         ax.set_xlabel(f'Distancia desde Centro del Segmento ({unit_label})', fontsize=12, fontweight='bold')
@@ -560,17 +570,11 @@ class DeflexionApp:
                  fontsize=10, framealpha=0.9)
         
         # **INFORMACIÓN TÉCNICA EN PANEL**
-        # Determinar unidades para mostrar en el panel
-        if hasattr(self, 'unit_system') and self.unit_system.get() == "imperial":
-            diagonal_display = diagonal_half / 25.4
-            unit_length = "in"
-            unit_force = "tons"
-            force_value = transfer_metrics['transfer_force'] / 4.448  # kN a tons
-        else:
-            diagonal_display = diagonal_half
-            unit_length = "mm"
-            unit_force = "kN"
-            force_value = transfer_metrics['transfer_force']
+        # Unidades para mostrar en el panel
+        diagonal_display = diagonal_half_display
+        unit_length = self._unit_len_label
+        unit_force = self._unit_force_label
+        force_value = transfer_metrics['transfer_force'] / self._force_to_kN
             
         info_text = f"""MÉTRICAS TÉCNICAS:
 ━━━━━━━━━━━━━━━━━━━━━━━━
@@ -665,8 +669,9 @@ según la teoría de Westergaard"""
                bbox=dict(boxstyle='round,pad=0.6', facecolor='lightyellow', 
                         alpha=0.9, edgecolor='orange', linewidth=2))
 
-    def show_diamond_analysis_summary(self, lte_average, transfer_metrics, lte_values):
+    def show_diamond_analysis_summary(self, lte_average, transfer_metrics, lte_values, inp=None):
         """Resumen técnico para análisis de herramientas diamante"""
+        inp = inp or self._snapshot_inputs()
         
         # Evaluación técnica basada en estándares industriales
         if lte_average >= 0.90:
@@ -694,9 +699,9 @@ según la teoría de Westergaard"""
             wear_prediction = "Vida útil corta - reemplazo frecuente"
         
         # Obtener unidades según sistema
-        unit_system = "Métrico (SI)" if self.unit_system.get() == "metric" else "Imperial"
-        unit_length = "mm" if self.unit_system.get() == "metric" else "in"
-        unit_force = "kN" if self.unit_system.get() == "metric" else "tons"
+        unit_system = "Métrico (SI)" if inp.unit_system == "metric" else "Imperial"
+        unit_length = self._unit_len_label
+        unit_force = self._unit_force_label
         
         summary = f"""
 🔬 ANÁLISIS TÉCNICO AVANZADO - HERRAMIENTA DIAMANTE LTE
@@ -704,10 +709,10 @@ según la teoría de Westergaard"""
 
 📊 PARÁMETROS DE ENTRADA:
 • Sistema de Unidades: {unit_system}
-• Geometría Segmento: {self.side_mm.get():.1f} {unit_length} (lado total)
+• Geometría Segmento: {inp.side_mm:.1f} {unit_length} (lado total)
 • Diagonal Media Dovela: {transfer_metrics['diagonal_half']:.1f} mm
-• Espesor Herramienta: {self.thickness_in.get():.2f} {unit_length}
-• Carga de Trabajo: {self.tons_load.get():.1f} {unit_force}
+• Espesor Herramienta: {inp.thickness_in:.2f} {unit_length}
+• Carga de Trabajo: {inp.tons_load:.1f} {unit_force}
 • Rigidez Relativa (E_dovela/E_matriz): {transfer_metrics['stiffness_ratio']:.1f}
 
 🎯 RESULTADOS LOAD TRANSFER EFFICIENCY:
@@ -783,12 +788,21 @@ en juntas de construcción o expansión.
         messagebox.showinfo("Ayuda - Análisis FEA de Dovela Diamante", help_text)
 
     # Métodos de cálculo base (simplificados para que funcione)
-    def calculate_base_results(self):
+    def calculate_base_results(self, inp=None):
         """Calcular resultados base del FEA - Media dovela (mitad del diamante)"""
         try:
+            inp = inp or self._snapshot_inputs()
+            
             # Parámetros geométricos básicos
-            side_mm = self.side_mm.get() if self.unit_system.get() == "metric" else self.side_mm.get() * 25.4
-            ap_mm = self.ap_mm.get() if self.unit_system.get() == "metric" else self.ap_mm.get() * 25.4
+            side_mm = inp.side_mm * self._len_to_mm
+            ap_mm = inp.ap_mm * self._len_to_mm
+            
+            # Reutilizar malla y deflexiones si la geometría (ya en mm) no cambió:
+            # el resultado solo depende del lado y de la apertura de junta
+            key = (side_mm, ap_mm)
+            cached = self._fem_cache.get(key)
+            if cached is not None:
+                return cached
             
             # Crear malla refinada para contornos más claros
             n_points = 80  # Mayor resolución para contornos más suaves
@@ -836,8 +850,14 @@ en juntas de construcción o expansión.
                     self.t = triangs.triangles.T
             
             mesh = SimpleMesh(coords)
+            for array in (w_vals, coords, mask_tri):
+                array.flags.writeable = False  # Compartidos a través de la caché
             
-            return mesh, w_vals, coords, triangs.triangles, mask_tri
+            result = (mesh, w_vals, coords, triangs.triangles, mask_tri)
+            if len(self._fem_cache) >= FEM_CACHE_SIZE:
+                self._fem_cache.pop(next(iter(self._fem_cache)))
+            self._fem_cache[key] = result
+            return result
             
         except Exception as e:
             raise Exception(f"Error en cálculo base: {str(e)}")
@@ -851,8 +871,8 @@ en juntas de construcción o expansión.
             # La máxima deflexión debe estar en el borde cargado donde hay máximos esfuerzos
             
             # Obtener geometría
-            side_mm = self.side_mm.get() if self.unit_system.get() == "metric" else self.side_mm.get() * 25.4
-            ap_mm = self.ap_mm.get() if self.unit_system.get() == "metric" else self.ap_mm.get() * 25.4
+            side_mm = self.side_mm.get() * self._len_to_mm
+            ap_mm = self.ap_mm.get() * self._len_to_mm
             diagonal_half = (side_mm * np.sqrt(2)) / 2
             
             # Calcular deflexiones corregidas basadas en la teoría de vigas
@@ -893,7 +913,6 @@ en juntas de construcción o expansión.
             fig, ax = plt.subplots(figsize=(12, 10))
             
             # === VISUALIZACIÓN CON CONTORNOS SUAVES ===
-            from scipy.interpolate import griddata
             from scipy.ndimage import gaussian_filter
             
             # Crear malla regular para contornos suaves
@@ -902,7 +921,7 @@ en juntas de construcción o expansión.
             X_smooth, Y_smooth = np.meshgrid(x_smooth, y_smooth)
             
             # Interpolar deflexiones corregidas a malla regular
-            w_smooth = griddata(coords, w_vals_corrected, (X_smooth, Y_smooth), method='cubic', fill_value=0)
+            w_smooth = self._cubic_interpolator(coords, w_vals_corrected)((X_smooth, Y_smooth))
             
             # Aplicar máscara para la mitad del diamante
             mask_half_diamond = (np.abs(X_smooth - ap_mm/2) + np.abs(Y_smooth)) <= diagonal_half
@@ -969,12 +988,12 @@ en juntas de construcción o expansión.
                    label=f'Máximo: {max_defl_val:.3f} {unit_defl}')
             
             # Calcular parámetros importantes
-            junta = self.ap_mm.get() if self.unit_system.get() == "metric" else self.ap_mm.get() * 25.4
+            junta = self.ap_mm.get() * self._len_to_mm
             L_eff = diagonal_half * 0.85  # Longitud efectiva estimada para media dovela
             
-            if self.unit_system.get() != "metric":
-                junta = junta / 25.4  # Convertir a pulgadas para display
-                L_eff = L_eff / 25.4
+            # Convertir a unidades de display
+            junta = junta / self._len_to_mm
+            L_eff = L_eff / self._len_to_mm
             
             # Mostrar información técnica en la gráfica
             info_text = f"""Carga: {load_kN:.1f} kN
@@ -1018,8 +1037,8 @@ Análisis profesional coherente"""
             mesh, w_vals, coords, triangs, mask_tri = self.calculate_base_results()
             
             # Obtener parámetros de geometría
-            side_mm = self.side_mm.get() if self.unit_system.get() == "metric" else self.side_mm.get() * 25.4
-            ap_mm = self.ap_mm.get() if self.unit_system.get() == "metric" else self.ap_mm.get() * 25.4
+            side_mm = self.side_mm.get() * self._len_to_mm
+            ap_mm = self.ap_mm.get() * self._len_to_mm
             load_input = self.tons_load.get()
             thickness_input = self.thickness_in.get()
             
@@ -1245,7 +1264,7 @@ Análisis profesional coherente"""
         # === TEORÍA DE WESTERGAARD PARA TRANSFERENCIA DE CARGA ===
         
         # Obtener valor de apertura de junta para los cálculos
-        ap_mm = self.ap_mm.get() if self.unit_system.get() == "metric" else self.ap_mm.get() * 25.4
+        ap_mm = self.ap_mm.get() * self._len_to_mm
         
         # Área de contacto efectiva (lado cargado de la dovela)
         area_contact = width_effective * thickness_mm  # mm²
@@ -1358,8 +1377,8 @@ Análisis profesional coherente"""
             mesh, w_vals, coords, triangs, mask_tri = self.calculate_base_results()
             
             # Obtener parámetros DE GEOMETRÍA PRIMERO
-            side_mm = self.side_mm.get() if self.unit_system.get() == "metric" else self.side_mm.get() * 25.4
-            ap_mm = self.ap_mm.get() if self.unit_system.get() == "metric" else self.ap_mm.get() * 25.4
+            side_mm = self.side_mm.get() * self._len_to_mm
+            ap_mm = self.ap_mm.get() * self._len_to_mm
             load_input = self.tons_load.get()
             thickness_input = self.thickness_in.get()
             
@@ -1403,7 +1422,6 @@ Análisis profesional coherente"""
                 stress_vals = stress_vals[:len(coords)]
             
             # Contorno principal con niveles optimizados y suavizado
-            from scipy.interpolate import griddata
             from scipy.ndimage import gaussian_filter
             
             # Crear malla regular para contornos suaves
@@ -1413,7 +1431,7 @@ Análisis profesional coherente"""
             X_smooth, Y_smooth = np.meshgrid(x_smooth, y_smooth)
             
             # Interpolar valores de esfuerzo a malla regular
-            stress_smooth = griddata(coords, stress_vals, (X_smooth, Y_smooth), method='cubic', fill_value=0)
+            stress_smooth = self._cubic_interpolator(coords, stress_vals)((X_smooth, Y_smooth))
             
             # Aplicar máscara para la mitad del diamante
             mask_half_diamond = (np.abs(X_smooth - ap_mm/2) + np.abs(Y_smooth)) <= diagonal_half
@@ -1457,8 +1475,8 @@ Análisis profesional coherente"""
                 unit_len = "in"
             
             # Dibujar contorno de la media dovela (mitad del diamante)
-            side_mm = self.side_mm.get() if self.unit_system.get() == "metric" else self.side_mm.get() * 25.4
-            ap_mm = self.ap_mm.get() if self.unit_system.get() == "metric" else self.ap_mm.get() * 25.4
+            side_mm = self.side_mm.get() * self._len_to_mm
+            ap_mm = self.ap_mm.get() * self._len_to_mm
             diagonal_half = (side_mm * np.sqrt(2)) / 2
             
             # Contorno de la mitad del diamante (lado derecho)
@@ -1752,12 +1770,19 @@ Análisis profesional coherente"""
             
         return stress_shear
     
+    def _cubic_interpolator(self, coords, values):
+        """Interpolante cúbico (Clough-Tocher, como griddata 'cubic') sobre una
+        triangulación de Delaunay reutilizada mientras los puntos no cambien"""
+        cached = self._delaunay_cache
+        if cached is None or not np.array_equal(cached[0], coords):
+            cached = (coords.copy(), Delaunay(coords))
+            self._delaunay_cache = cached
+        return CloughTocher2DInterpolator(cached[1], values, fill_value=0)
+
     def interpolate_to_grid(self, coords, stress_values, X, Y, mask):
         """Interpolar valores de esfuerzo a malla regular"""
-        from scipy.interpolate import griddata
-        
         # Interpolar
-        grid_stress = griddata(coords, stress_values, (X, Y), method='cubic', fill_value=0)
+        grid_stress = self._cubic_interpolator(coords, stress_values)((X, Y))
         
         # Aplicar máscara
         grid_stress[~mask] = np.nan
@@ -1849,84 +1874,6 @@ CRITERIOS APLICADOS:
         
         ax.set_xlim(0, 1)
         ax.set_ylim(0, 1)
-            
-            # VISUALIZACIÓN PROFESIONAL (como en las imágenes de referencia)
-            fig, ax = plt.subplots(figsize=(10, 12))
-            
-            # Niveles suaves para contornos profesionales
-            max_stress = np.nanmax(grid_stress)
-            if max_stress <= 0:
-                max_stress = 100  # Valor por defecto
-            levels = np.linspace(0, max_stress, 25)
-            
-            # Contornos rellenos suaves (matching reference images)
-            contour = ax.contourf(X, Y, grid_stress, levels=levels, cmap='plasma', extend='max')
-            
-            # Líneas de contorno blancas (como en las imágenes)
-            contour_lines = ax.contour(X, Y, grid_stress, levels=8, colors='white', 
-                                     linewidths=1.2, alpha=0.8)
-            
-            # Contorno del diamante con línea negra gruesa
-            diamond_x = np.array([0, diagonal_half, 0, -diagonal_half, 0])
-            diamond_y = np.array([diagonal_half, 0, -diagonal_half, 0, diagonal_half])
-            ax.plot(diamond_x, diamond_y, 'k-', linewidth=3, alpha=0.9)
-            
-            # Marcar lado cargado con línea roja gruesa (como en las imágenes)
-            loaded_side_x = [-diagonal_half, -diagonal_half]
-            loaded_side_y = [-diagonal_half, diagonal_half]
-            ax.plot(loaded_side_x, loaded_side_y, 'r-', linewidth=8, 
-                   alpha=0.9, label='Lado Cargado')
-            
-            # Punto de máximo esfuerzo von Mises
-            valid_coords = coords[stress_von_mises > 0]
-            valid_stress = stress_von_mises[stress_von_mises > 0]
-            if len(valid_stress) > 0:
-                max_idx = np.argmax(valid_stress)
-                ax.plot(valid_coords[max_idx, 0], valid_coords[max_idx, 1], 'ro', markersize=12, 
-                       markeredgecolor='darkred', markeredgewidth=2,
-                       label=f'Max esfuerzo von mises: {max_stress:.1f} MPa')
-            
-            # Configuración profesional (como en las imágenes)
-            ax.set_aspect('equal')
-            ax.set_xlim(-diagonal_half*1.15, diagonal_half*1.15)
-            ax.set_ylim(-diagonal_half*1.15, diagonal_half*1.15)
-            ax.set_xlabel('X (mm)', fontsize=14, fontweight='bold')
-            ax.set_ylabel('Y (mm)', fontsize=14, fontweight='bold')
-            
-            # Título profesional (matching reference images)
-            title = f'Esfuerzo von Mises - Dovela Diamante (Westergaard)\nCarga: {load_kN} kN - Espesor: {thickness_mm} mm'
-            ax.set_title(title, fontsize=14, fontweight='bold', pad=20)
-            
-            # Grid sutil
-            ax.grid(True, alpha=0.3, linestyle='--', linewidth=0.5, color='gray')
-            ax.tick_params(labelsize=12)
-            
-            # Leyenda (como en las imágenes)
-            ax.legend(fontsize=11, loc='lower right', framealpha=0.9,
-                     facecolor='white', edgecolor='black')
-            
-            # Colorbar vertical (como en las imágenes)
-            cbar = plt.colorbar(contour, ax=ax, shrink=0.9, pad=0.08, aspect=25)
-            cbar.set_label('Esfuerzo von Mises (MPa)', fontsize=12, fontweight='bold', labelpad=15)
-            cbar.ax.tick_params(labelsize=11)
-            
-            # Cuadro de información técnica (como en las imágenes)
-            info_text = f"""Teoría de Westergaard
-Máximo: {max_stress:.1f} MPa
-Ubicación: Borde cargado  
-Factor seguridad: {250/max_stress:.1f}"""
-            
-            props = dict(boxstyle='round,pad=0.5', facecolor='lightgray', 
-                        alpha=0.95, edgecolor='black', linewidth=1.5)
-            ax.text(0.05, 0.95, info_text, transform=ax.transAxes, 
-                   fontsize=11, verticalalignment='top', bbox=props,
-                   fontweight='bold', fontfamily='monospace')
-            
-            plt.tight_layout()
-            plt.show()
-            
-        except Exception as e:
-            messagebox.showerror("Error", f"Error en análisis de esfuerzos: {str(e)}")
 
 def main():
     root = tk.Tk()
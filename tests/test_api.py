@@ -0,0 +1,291 @@
+#!/usr/bin/env python3
+"""
+Pruebas de la API web: caché de resultados, imágenes y manejo de errores
+"""
+
+import asyncio
+import os
+import sys
+import threading
+import zlib
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from fastapi.testclient import TestClient
+
+import api.main as api_main
+
+PAYLOAD = {"load_kN": 22.2, "thickness_mm": 12.7, "analysis_type": "von_mises"}
+
+
+@pytest.fixture
+def client():
+    """Cliente sin lifespan: los análisis corren en el pool de hilos de respaldo"""
+    api_main._analysis_cache.clear()
+    api_main._image_cache.clear()
+    yield TestClient(api_main.app)
+    api_main._analysis_cache.clear()
+    api_main._image_cache.clear()
+
+
+@pytest.fixture
+def analysis_calls(monkeypatch):
+    """Registrar cada análisis que llega al pool"""
+    calls = []
+    original = api_main.analyze_dowel
+
+    def counting(*args):
+        calls.append(args)
+        return original(*args)
+
+    monkeypatch.setattr(api_main, "analyze_dowel", counting)
+    return calls
+
+
+def test_cache_hit_returns_same_stats(client, analysis_calls):
+    """Entradas repetidas (tras redondear) reutilizan el análisis ya calculado"""
+    first = client.post("/analyze", json=PAYLOAD)
+    second = client.post("/analyze", json=dict(PAYLOAD, load_kN=22.2000001))
+
+    assert first.status_code == second.status_code == 200
+    assert first.json() == second.json()
+    assert len(analysis_calls) == 1
+
+
+def test_post_responses_are_not_marked_cacheable(client):
+    """Las respuestas POST no llevan Cache-Control (las cachés compartidas no las reutilizan)"""
+    assert "cache-control" not in client.post("/analyze", json=PAYLOAD).headers
+    batch = client.post("/analyze_batch", json={"items": [PAYLOAD]})
+    assert batch.status_code == 200
+    assert "cache-control" not in batch.headers
+
+
+def test_grid_round_trip(client):
+    """La malla enviada con include_grid se decodifica al campo de esfuerzos del análisis"""
+    response = client.post("/analyze", json=dict(PAYLOAD, include_grid=True))
+    assert response.status_code == 200
+    data = response.json()
+
+    raw = zlib.decompress(api_main.base64.b64decode(data["stress_grid"]))
+    grid = np.frombuffer(raw, dtype='<f2').reshape(data["grid_shape"])
+    key = api_main._analysis_key(PAYLOAD["load_kN"], PAYLOAD["thickness_mm"],
+                                 PAYLOAD["analysis_type"], api_main.MESH_RESOLUTION)
+    field = asyncio.run(api_main._get_analysis(key)).stress_field
+
+    assert data["grid_shape"] == [api_main.MESH_RESOLUTION] * 2
+    assert data["grid_extent"] == [-35.0, 35.0, -35.0, 35.0]
+    np.testing.assert_array_equal(np.isnan(grid), np.isnan(field))
+    np.testing.assert_allclose(grid, field, rtol=1e-3, equal_nan=True)
+    assert np.nanmax(grid) == pytest.approx(data["stress_max"], rel=1e-3)
+
+
+def test_grid_only_when_requested(client):
+    """Sin include_grid la respuesta no lleva la malla"""
+    data = client.post("/analyze", json=PAYLOAD).json()
+    assert "stress_grid" not in data and "grid_shape" not in data
+
+
+def test_load_is_bounded(client):
+    """Cargas fuera de rango se rechazan antes de calcular (la malla float16 no desborda)"""
+    too_large = dict(PAYLOAD, load_kN=api_main.MAX_LOAD_KN * 10)
+    assert client.post("/analyze", json=too_large).status_code == 422
+    assert client.get("/analyze.png", params={"load_kN": -1}).status_code == 422
+
+
+def test_failed_analysis_does_not_poison_next_request(client, monkeypatch):
+    """Un error no queda en caché: la siguiente petición con las mismas entradas recalcula"""
+    original = api_main.analyze_dowel
+
+    def failing(*args):
+        raise api_main.AnalysisError("Error en el análisis: fallo simulado")
+
+    monkeypatch.setattr(api_main, "analyze_dowel", failing)
+    failed = client.post("/analyze", json=PAYLOAD)
+    assert failed.status_code == 500
+    assert "fallo simulado" in failed.json()["detail"]
+
+    monkeypatch.setattr(api_main, "analyze_dowel", original)
+    retried = client.post("/analyze", json=PAYLOAD)
+    assert retried.status_code == 200
+    assert retried.json()["stress_max"] > 0
+
+
+def test_failure_keeps_other_cached_results(client, analysis_calls):
+    """Un análisis fallido no descarta los resultados correctos de otras entradas"""
+    assert client.post("/analyze", json=PAYLOAD).status_code == 200
+
+    # Espesor nulo: la deformación divide por cero dentro del análisis
+    assert client.post("/analyze", json=dict(PAYLOAD, thickness_mm=0.0)).status_code == 500
+
+    assert client.post("/analyze", json=PAYLOAD).status_code == 200
+    assert len(analysis_calls) == 2
+
+
+def test_cancelled_wait_does_not_cancel_shared_analysis(monkeypatch):
+    """Cancelar la espera de un cliente no cancela ni envenena el análisis en curso"""
+    release = threading.Event()
+    original = api_main.analyze_dowel
+
+    def slow(*args):
+        release.wait(timeout=10)
+        return original(*args)
+
+    monkeypatch.setattr(api_main, "analyze_dowel", slow)
+    key = api_main._analysis_key(22.2, 12.7, "von_mises", api_main.MESH_RESOLUTION)
+
+    async def scenario():
+        api_main._analysis_cache.clear()
+        waiter = asyncio.ensure_future(api_main._get_analysis(key))
+        await asyncio.sleep(0.05)
+        waiter.cancel()  # p. ej. el cliente se desconecta
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        release.set()
+        return await api_main._get_analysis(key)
+
+    try:
+        analysis = asyncio.run(scenario())
+    finally:
+        api_main._analysis_cache.clear()
+    assert analysis.stats["stress_max"] > 0
+
+
+def test_plot_image_kept_for_existing_clients(client):
+    """POST /analyze sigue devolviendo la imagen en Base64 salvo que se desactive"""
+    data = client.post("/analyze", json=PAYLOAD).json()
+    header, encoded = data["plot_image"].split(",", 1)
+    assert header == "data:image/png;base64"
+
+    png = client.get("/analyze.png", params=PAYLOAD)
+    assert png.status_code == 200
+    assert api_main.base64.b64decode(encoded) == png.content
+
+    data = client.post("/analyze", json=dict(PAYLOAD, include_image=False)).json()
+    assert "plot_image" not in data
+
+
+def test_matching_etag_returns_304_without_rendering(client, monkeypatch):
+    """If-None-Match con el ETag vigente responde 304 sin calcular ni renderizar"""
+    first = client.get("/analyze.png", params=PAYLOAD)
+    assert first.status_code == 200
+    assert first.headers["cache-control"] == api_main.CACHE_CONTROL
+    etag = first.headers["etag"]
+
+    def unexpected(*args):
+        raise AssertionError("no debería renderizar")
+
+    monkeypatch.setattr(api_main, "render_dowel_image", unexpected)
+    api_main._image_cache.clear()
+    cached = client.get("/analyze.png", params=PAYLOAD,
+                        headers={"If-None-Match": f'"otro", W/{etag}'})
+    assert cached.status_code == 304
+    assert cached.headers["etag"] == etag
+    assert cached.content == b""
+
+
+def test_weak_etag_returns_304(client):
+    """Un ETag débil (W/"...") enviado solo también valida la imagen cacheada"""
+    etag = client.get("/analyze.webp", params=PAYLOAD).headers["etag"]
+    cached = client.get("/analyze.webp", params=PAYLOAD, headers={"If-None-Match": f"W/{etag}"})
+    assert cached.status_code == 304
+    assert cached.headers["etag"] == etag
+
+
+def test_failed_render_does_not_poison_image(client, monkeypatch):
+    """Un error al renderizar no deja la imagen rota para las siguientes peticiones"""
+    original = api_main.render_dowel_image
+
+    def failing(*args):
+        raise api_main.AnalysisError("Error al generar la imagen: fallo simulado")
+
+    monkeypatch.setattr(api_main, "render_dowel_image", failing)
+    assert client.get("/analyze.png", params=PAYLOAD).status_code == 500
+
+    monkeypatch.setattr(api_main, "render_dowel_image", original)
+    retried = client.get("/analyze.png", params=PAYLOAD)
+    assert retried.status_code == 200
+    assert retried.headers["content-type"] == "image/png"
+
+
+def test_cancelled_wait_does_not_poison_image(monkeypatch):
+    """Cancelar la espera de una imagen no cancela el render compartido"""
+    release = threading.Event()
+    original = api_main.render_dowel_image
+
+    def slow(*args):
+        release.wait(timeout=10)
+        return original(*args)
+
+    monkeypatch.setattr(api_main, "render_dowel_image", slow)
+    key = api_main._analysis_key(22.2, 12.7, "von_mises", api_main.MESH_RESOLUTION)
+
+    async def scenario():
+        api_main._analysis_cache.clear()
+        api_main._image_cache.clear()
+        waiter = asyncio.ensure_future(api_main._get_image(key, "png"))
+        await asyncio.sleep(0.05)
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        release.set()
+        return await api_main._get_image(key, "png")
+
+    try:
+        image = asyncio.run(scenario())
+    finally:
+        api_main._analysis_cache.clear()
+        api_main._image_cache.clear()
+    assert image.startswith(b"\x89PNG")
+
+
+@pytest.mark.parametrize("origin", [
+    "https://dovela-professional.vercel.app",
+    "https://dovela-professional-fzaoag472-germanrey12s-projects.vercel.app",
+    "http://localhost:3000",
+])
+def test_cors_allows_frontend_origins(client, origin):
+    """El frontend de producción, las previews y el servidor de desarrollo pasan el preflight"""
+    preflight = client.options("/analyze", headers={
+        "Origin": origin,
+        "Access-Control-Request-Method": "POST",
+        "Access-Control-Request-Headers": "Content-Type",
+    })
+    assert preflight.status_code == 200
+    assert preflight.headers["access-control-allow-origin"] == origin
+
+
+def test_cors_rejects_other_origins(client):
+    """Otros orígenes no reciben cabeceras CORS"""
+    preflight = client.options("/analyze", headers={
+        "Origin": "https://dovela-professional.vercel.app.evil.com",
+        "Access-Control-Request-Method": "POST",
+    })
+    assert preflight.status_code == 400
+    assert "access-control-allow-origin" not in preflight.headers
+
+
+def test_lifespan_shutdown_without_cancel_futures(monkeypatch):
+    """En Python 3.8 (sin cancel_futures) el pool se apaga y se cancelan los trabajos pendientes"""
+    shutdowns = []
+
+    class Pool38:
+        def __init__(self, *args, **kwargs):
+            pass
+
+        def shutdown(self, wait=True):  # firma de Python 3.8
+            shutdowns.append(wait)
+
+    pending = api_main.Future()
+    monkeypatch.setattr(api_main, "ProcessPoolExecutor", Pool38)
+    monkeypatch.setattr(api_main.sys, "version_info", (3, 8, 18))
+    monkeypatch.setattr(api_main, "_pool_futures", {pending})
+
+    with TestClient(api_main.app):
+        assert isinstance(api_main.executor, Pool38)
+
+    assert shutdowns == [False]
+    assert pending.cancelled()
+    assert api_main.executor is None
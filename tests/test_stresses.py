@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Pruebas del paso de esfuerzos por elemento a nodos (promedio ponderado por área)
+"""
+
+import os
+import sys
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+pytest.importorskip("pygmsh")  # dependencia de la interfaz para el mallado
+
+import deflexion_gui
+
+
+@pytest.fixture
+def app():
+    """Instancia sin ventana: solo se usan los métodos de cálculo"""
+    app = deflexion_gui.DeflexionApp.__new__(deflexion_gui.DeflexionApp)
+    app._stress_cache = None
+    return app
+
+
+@pytest.fixture
+def inp():
+    """Entradas mínimas del cálculo de esfuerzos (acero, sistema imperial)"""
+    return SimpleNamespace(E_dowel=29000.0, nu_dowel=0.3, thickness_in=0.25,
+                           units=deflexion_gui.IMPERIAL)
+
+
+def element_von_mises(app, mesh, w_vals, coords, inp):
+    """von Mises de cada elemento, sin pasar a nodos"""
+    _, sigma_x, sigma_y, tau_xy, _, _ = app._element_plate_stresses(mesh, w_vals, coords, inp)
+    return np.sqrt(sigma_x**2 + sigma_y**2 - sigma_x*sigma_y + 3*tau_xy**2)
+
+
+def test_uniform_field_is_unchanged(app, inp):
+    """Con el mismo esfuerzo en todos los elementos, cada nodo recibe ese valor"""
+    coords = np.array([[0.0, 0.0], [1.0, 0.0], [0.0, 1.0], [4.0, 4.0], [2.0, -1.0]])
+    mesh = SimpleNamespace(t=np.array([[0, 1, 2], [1, 3, 2], [0, 4, 1]]).T)
+    w_vals = 0.002 * coords[:, 0] - 0.001 * coords[:, 1]  # gradiente constante
+
+    element_vm = element_von_mises(app, mesh, w_vals, coords, inp)
+    stress_vm = app._compute_all_stresses(mesh, w_vals, coords, inp).von_mises
+
+    assert element_vm.min() > 0
+    np.testing.assert_allclose(element_vm, element_vm[0], rtol=1e-12)
+    np.testing.assert_allclose(stress_vm, element_vm[0], rtol=1e-12)
+
+
+def test_shared_nodes_use_area_weighted_mean(app, inp):
+    """Dos elementos de áreas distintas: los nodos compartidos reciben la media ponderada por área"""
+    coords = np.array([[0.0, 0.0], [1.0, 0.0], [0.0, 1.0], [4.0, 4.0]])
+    mesh = SimpleNamespace(t=np.array([[0, 1, 2], [1, 3, 2]]).T)
+    w_vals = np.array([0.0, 0.0, 0.0, 0.01])  # solo se deforma el elemento grande
+    areas = np.array([0.5, 3.5])
+
+    element_vm = element_von_mises(app, mesh, w_vals, coords, inp)
+    stress_vm = app._compute_all_stresses(mesh, w_vals, coords, inp).von_mises
+
+    weighted = np.dot(areas, element_vm) / areas.sum()
+    assert element_vm[0] == 0 and element_vm[1] > 0
+    np.testing.assert_allclose(stress_vm[[1, 2]], weighted, rtol=1e-12)
+    assert not np.allclose(stress_vm[[1, 2]], element_vm.mean())
+    # Los nodos de un solo elemento conservan su valor
+    np.testing.assert_allclose(stress_vm[[0, 3]], element_vm, rtol=1e-12)
@@ -35,14 +35,14 @@ document.addEventListener('DOMContentLoaded', () => {
   };
 
   // Función para mostrar resultados
-  const displayResults = (data) => {
+  const displayResults = (data, imageUrl) => {
     // Ocultar carga y mostrar resultados
     loadingElement.classList.add('hidden');
     resultsContent.classList.remove('hidden');
     errorMessage.classList.add('hidden');
     
-    // Mostrar imagen de análisis
-    plotImage.src = data.plot_image;
+    // Mostrar imagen de análisis (PNG servido aparte y cacheable por el navegador)
+    plotImage.src = imageUrl;
     
     // Actualizar métricas
     stressMaxElement.textContent = `${data.stress_max.toFixed(2)} MPa`;
@@ -86,7 +86,8 @@ document.addEventListener('DOMContentLoaded', () => {
     const analysisData = {
       load_kN: parseFloat(loadInput.value),
       thickness_mm: parseFloat(thicknessInput.value),
-      analysis_type: analysisTypeSelect.value
+      analysis_type: analysisTypeSelect.value,
+      include_image: false  // la imagen se carga aparte desde /analyze.png
     };
 
     try {
@@ -112,7 +113,12 @@ document.addEventListener('DOMContentLoaded', () => {
       }
       
       const data = await response.json();
-      displayResults(data);
+      const imageParams = new URLSearchParams({
+        load_kN: analysisData.load_kN,
+        thickness_mm: analysisData.thickness_mm,
+        analysis_type: analysisData.analysis_type
+      });
+      displayResults(data, `${apiBaseUrl}/analyze.png?${imageParams}`);
     } catch (error) {
       console.error('Error:', error);
       displayError(error.message);